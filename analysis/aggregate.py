@@ -8,47 +8,154 @@ data/processed/validation-summary.json with one record per skill.
 
 from __future__ import annotations
 
-import json
+import mmap
+import os
 import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+import msgspec
+import orjson
+
+try:
+    import ijson
+except ImportError:  # optional: only used to stream very large validator outputs
+    ijson = None
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 RAW_DIR = REPO_ROOT / "data" / "raw"
 OUTPUT = REPO_ROOT / "data" / "processed" / "validation-summary.json"
 
-
-def extract_skill_record(filepath: Path, category: str) -> dict:
+# Validator outputs at least this large are streamed with ijson (when installed)
+# instead of being decoded in one shot
+STREAM_THRESHOLD = 1024 * 1024
+# Below this size a plain read is cheaper than setting up a memory map
+MMAP_THRESHOLD = 16 * 1024
+
+
+class Result(msgspec.Struct):
+    """One entry of a validator results / link_results list."""
+    level: str = "unknown"
+    category: str = "unknown"
+    message: str = ""
+
+
+class TokenFile(msgspec.Struct):
+    file: str = ""
+    tokens: int = 0
+
+
+class TokenCounts(msgspec.Struct):
+    total: int = 0
+    files: list[TokenFile] = []
+
+
+class SkillFileHead(msgspec.Struct):
+    """The parts of a skill's validator JSON that aggregation reads, apart
+    from the results / link_results lists (see SkillFile).
+
+    Undeclared keys are skipped by the decoder rather than materialized.
+    Field annotations are evaluated by msgspec, so they use Optional rather
+    than ``X | None`` to stay importable on Python 3.9.
+    """
+    skill_dir: str = ""
+    passed: bool = False
+    errors: int = 0
+    warnings: int = 0
+    token_counts: TokenCounts = msgspec.field(default_factory=TokenCounts)
+    other_token_counts: TokenCounts = msgspec.field(default_factory=TokenCounts)
+    link_errors: int = 0
+    link_warnings: int = 0
+    content_analysis: Optional[dict] = None
+    contamination_analysis: Optional[dict] = None
+    references_content_analysis: Optional[dict] = None
+    references_contamination_analysis: Optional[dict] = None
+    reference_reports: Optional[list[dict]] = None
+
+
+class SkillFile(SkillFileHead):
+    """A skill's validator JSON, result lists included."""
+    results: list[Result] = []
+    link_results: list[Result] = []
+
+
+# Result levels the validator emits, in the order they are reported
+RESULT_LEVELS = ("pass", "info", "warning", "error")
+RESULT_LEVEL_INDEX = {level: i for i, level in enumerate(RESULT_LEVELS)}
+
+SKILL_FILE_DECODER = msgspec.json.Decoder(SkillFile)
+SKILL_FILE_HEAD_DECODER = msgspec.json.Decoder(SkillFileHead)
+
+
+def _stream_results(filepath: str, key: str) -> Iterator[Result]:
+    """Yield the entries of a top-level result list one at a time."""
+    with open(filepath, "rb") as f:
+        for item in ijson.items(f, f"{key}.item", use_float=True):
+            yield msgspec.convert(item, Result)
+
+
+def read_skill_file(filepath: str) -> tuple[SkillFileHead, Iterable[Result], Iterable[Result]]:
+    """Decode a skill's validator JSON; returns (fields, results, link_results).
+
+    Files under MMAP_THRESHOLD are read directly and larger ones are
+    memory-mapped. For files over STREAM_THRESHOLD (with ijson installed)
+    only the other top-level fields are decoded from the map, the decoder
+    skipping both result lists; the lists are then streamed with ijson and
+    consumed one entry at a time, so they are never held in memory.
+    """
+    size = os.path.getsize(filepath)
+    if size < MMAP_THRESHOLD:
+        with open(filepath, "rb") as f:
+            data = SKILL_FILE_DECODER.decode(f.read())
+        return data, data.results, data.link_results
+    with open(filepath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if ijson is not None and size >= STREAM_THRESHOLD:
+            head = SKILL_FILE_HEAD_DECODER.decode(mm)
+            return head, _stream_results(filepath, "results"), _stream_results(filepath, "link_results")
+        data = SKILL_FILE_DECODER.decode(mm)
+    return data, data.results, data.link_results
+
+
+def extract_skill_record(filepath: str, skill_name: str, category: str) -> dict:
     """Extract a summary record from a single skill's validator JSON."""
-    with open(filepath) as f:
-        data = json.load(f)
+    data, results, link_results = read_skill_file(filepath)
 
-    skill_name = filepath.stem
-    skill_dir = data.get("skill_dir", "")
+    skill_dir = data.skill_dir
 
-    # Count results by level
-    results = data.get("results", [])
-    level_counts = {}
-    category_counts = {}
+    # Count results by level into fixed slots (anything outside RESULT_LEVELS
+    # is still counted, after the known levels) and by category, which is
+    # open-ended (one per validator check group), in a single pass
+    level_slots = [0] * len(RESULT_LEVELS)
+    other_levels = Counter()
+    category_counts = Counter()
     for r in results:
-        level = r.get("level", "unknown")
-        cat = r.get("category", "unknown")
-        level_counts[level] = level_counts.get(level, 0) + 1
-        category_counts[cat] = category_counts.get(cat, 0) + 1
+        i = RESULT_LEVEL_INDEX.get(r.level)
+        if i is None:
+            other_levels[r.level] += 1
+        else:
+            level_slots[i] += 1
+        category_counts[r.category] += 1
+    level_counts = {level: n for level, n in zip(RESULT_LEVELS, level_slots) if n}
+    level_counts.update(other_levels)
+    category_counts = dict(category_counts)
 
     # Token counts — split token_counts.files into SKILL.md / references / assets
     # token_counts contains spec-compliant files: "SKILL.md body", "references/*", "assets/*"
     # other_token_counts contains everything else (non-standard dirs, root-level files)
-    token_counts = data.get("token_counts", {})
-    other_token_counts = data.get("other_token_counts", {})
+    token_counts = data.token_counts
+    other_token_counts = data.other_token_counts
 
     skill_md_tokens = 0
     ref_tokens = 0
     asset_tokens = 0
     ref_file_tokens = []    # per-file tokens for references/
     asset_file_tokens = []  # per-file tokens for assets/
-    for f in token_counts.get("files", []):
-        name = f.get("file", "")
-        tokens = f.get("tokens", 0)
+    for f in token_counts.files:
+        name = f.file
+        tokens = f.tokens
         if name == "SKILL.md body":
             skill_md_tokens = tokens
         elif name.startswith("references/"):
@@ -61,17 +168,17 @@ def extract_skill_record(filepath: Path, category: str) -> dict:
             # Unexpected entry in token_counts — count toward SKILL.md
             skill_md_tokens += tokens
 
-    nonstandard_tokens = other_token_counts.get("total", 0)
+    nonstandard_tokens = other_token_counts.total
     total_tokens = skill_md_tokens + ref_tokens + asset_tokens + nonstandard_tokens
 
     record = {
         "name": skill_name,
         "source": category,
         "skill_dir": skill_dir,
-        "passed": data.get("passed", False),
-        "errors": data.get("errors", 0),
-        "warnings": data.get("warnings", 0),
-        "passes": level_counts.get("pass", 0),
+        "passed": data.passed,
+        "errors": data.errors,
+        "warnings": data.warnings,
+        "passes": level_slots[RESULT_LEVEL_INDEX["pass"]],
         "total_tokens": total_tokens,
         "skill_md_tokens": skill_md_tokens,
         "ref_tokens": ref_tokens,
@@ -80,46 +187,40 @@ def extract_skill_record(filepath: Path, category: str) -> dict:
         "result_levels": level_counts,
         "result_categories": category_counts,
         "token_files": [
-            f["file"] for f in token_counts.get("files", [])
-        ] + [
-            f["file"] for f in other_token_counts.get("files", [])
+            f.file for f in chain(token_counts.files, other_token_counts.files)
         ],
     }
 
     # Link health (separated from structural pass/fail)
-    link_results = data.get("link_results", [])
-    link_errors = data.get("link_errors", 0)
-    link_warnings = data.get("link_warnings", 0)
     broken_links = []
     for r in link_results:
-        if r.get("level") == "error":
-            # Extract URL from message (format: "URL (error details)")
-            msg = r.get("message", "")
-            url = msg.split(" (")[0] if " (" in msg else msg
-            broken_links.append(url)
-
-    record["link_errors"] = link_errors
-    record["link_warnings"] = link_warnings
+        if r.level == "error":
+            # Extract URL from message (format: "URL (error details)");
+            # partition returns the whole message when there is no " ("
+            broken_links.append(r.message.partition(" (")[0])
+
+    record["link_errors"] = data.link_errors
+    record["link_warnings"] = data.link_warnings
     record["broken_links"] = broken_links
 
     # Content analysis (from skill-validator check -o json)
-    ca = data.get("content_analysis")
+    ca = data.content_analysis
     if ca:
         record["content_analysis"] = ca
 
     # Contamination analysis (from skill-validator check -o json)
-    ra = data.get("contamination_analysis")
+    ra = data.contamination_analysis
     if ra:
         record["contamination_analysis"] = ra
 
     # Reference file analysis (aggregate and per-file)
-    rca = data.get("references_content_analysis")
+    rca = data.references_content_analysis
     if rca:
         record["references_content_analysis"] = rca
-    rcr = data.get("references_contamination_analysis")
+    rcr = data.references_contamination_analysis
     if rcr:
         record["references_contamination_analysis"] = rcr
-    ref_reports = data.get("reference_reports")
+    ref_reports = data.reference_reports
     if ref_reports:
         record["reference_reports"] = ref_reports
 
@@ -160,28 +261,73 @@ def extract_skill_record(filepath: Path, category: str) -> dict:
 def main():
     OUTPUT.parent.mkdir(parents=True, exist_ok=True)
 
-    records = []
-    for category_dir in sorted(RAW_DIR.iterdir()):
-        if not category_dir.is_dir():
-            continue
-        category = category_dir.name
-        for filepath in sorted(category_dir.glob("*.json")):
-            record = extract_skill_record(filepath, category)
-            records.append(record)
+    # Collect inputs in sorted order first; executor.map preserves that order.
+    # os.scandir's DirEntry caches the entry type from the directory read, and
+    # skill names are sliced off the file names here rather than via Path.stem.
+    # Sources come out of the walk already in sorted order.
+    filepaths = []
+    skill_names = []
+    categories = []
+    sources = []
+    with os.scandir(RAW_DIR) as it:
+        category_dirs = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+    for category_dir in category_dirs:
+        with os.scandir(category_dir.path) as it:
+            names = sorted(e.name for e in it if e.name.endswith(".json") and e.is_file())
+        if names:
+            sources.append(category_dir.name)
+        for name in names:
+            filepaths.append(os.path.join(category_dir.path, name))
+            skill_names.append(name[:-len(".json")])
+            categories.append(category_dir.name)
+
+    # Each file is parsed independently, so fan out across processes
+    with ProcessPoolExecutor() as executor:
+        records = list(executor.map(
+            extract_skill_record, filepaths, skill_names, categories, chunksize=32
+        ))
+
+    # Summary stats, link health and per-source breakdown in one pass
+    passed = 0
+    total_errors = 0
+    total_warnings = 0
+    total_link_errors = 0
+    total_link_warnings = 0
+    skills_with_broken_links = 0
+    by_source = defaultdict(lambda: {
+        "total": 0,
+        "passed": 0,
+        "failed": 0,
+        "errors": 0,
+        "warnings": 0,
+        "broken_link_count": 0,
+    })
+    for r in records:
+        is_passed = bool(r["passed"])
+        link_errors = r["link_errors"]
+        passed += is_passed
+        total_errors += r["errors"]
+        total_warnings += r["warnings"]
+        total_link_errors += link_errors
+        total_link_warnings += r["link_warnings"]
+        skills_with_broken_links += link_errors > 0
+
+        s = by_source[r["source"]]
+        s["total"] += 1
+        s["passed"] += is_passed
+        s["failed"] += not is_passed
+        s["errors"] += r["errors"]
+        s["warnings"] += r["warnings"]
+        s["broken_link_count"] += link_errors
 
-    # Summary stats
     total = len(records)
-    passed = sum(1 for r in records if r["passed"])
     failed = total - passed
-    total_errors = sum(r["errors"] for r in records)
-    total_warnings = sum(r["warnings"] for r in records)
 
     # Load snapshot metadata if available
     metadata_path = OUTPUT.parent / "snapshot-metadata.json"
     snapshot_metadata = None
     if metadata_path.exists():
-        with open(metadata_path) as f:
-            snapshot_metadata = json.load(f)
+        snapshot_metadata = orjson.loads(metadata_path.read_bytes())
 
     summary = {
         "total_skills": total,
@@ -190,34 +336,17 @@ def main():
         "total_errors": total_errors,
         "total_warnings": total_warnings,
         "snapshot": snapshot_metadata,
-        "by_source": {},
+        "by_source": {source: by_source[source] for source in sources},
         "skills": records,
+        "link_health": {
+            "total_link_errors": total_link_errors,
+            "total_link_warnings": total_link_warnings,
+            "skills_with_broken_links": skills_with_broken_links,
+        },
     }
-
-    # Link health summary
-    total_link_errors = sum(r["link_errors"] for r in records)
-    skills_with_broken_links = sum(1 for r in records if r["link_errors"] > 0)
-    summary["link_health"] = {
-        "total_link_errors": total_link_errors,
-        "total_link_warnings": sum(r["link_warnings"] for r in records),
-        "skills_with_broken_links": skills_with_broken_links,
-    }
-
-    # Per-source breakdown
-    sources = sorted(set(r["source"] for r in records))
-    for source in sources:
-        source_records = [r for r in records if r["source"] == source]
-        summary["by_source"][source] = {
-            "total": len(source_records),
-            "passed": sum(1 for r in source_records if r["passed"]),
-            "failed": sum(1 for r in source_records if not r["passed"]),
-            "errors": sum(r["errors"] for r in source_records),
-            "warnings": sum(r["warnings"] for r in source_records),
-            "broken_link_count": sum(r["link_errors"] for r in source_records),
-        }
-
-    with open(OUTPUT, "w") as f:
-        json.dump(summary, f, indent=2)
+    # Compact by default; set PRETTY=1 for an indented file meant for reading
+    option = orjson.OPT_INDENT_2 if os.environ.get("PRETTY") else 0
+    OUTPUT.write_bytes(orjson.dumps(summary, option=option))
 
     print(f"Aggregated {total} skills → {OUTPUT}")
     print(f"  Passed: {passed}, Failed: {failed}")
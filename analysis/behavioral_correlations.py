@@ -18,43 +18,70 @@ Outputs a summary table to stdout showing:
 
 from __future__ import annotations
 
-import json
-import math
+from collections import defaultdict
+from operator import itemgetter
 from pathlib import Path
 from statistics import mean
 
+import numpy as np
+import orjson
+
+try:
+    from numba import njit
+except ImportError:  # optional: without numba the kernel runs as plain NumPy
+    njit = None
+
 REPO_ROOT = Path(__file__).resolve().parent.parent
 LLM_SCORES = REPO_ROOT / "data" / "processed" / "llm-scores.json"
 BEHAVIORAL = REPO_ROOT / "data" / "processed" / "behavioral-eval.json"
 COMBINED = REPO_ROOT / "data" / "processed" / "combined.json"
 
-SKILL_DIMS = [
+SKILL_DIMS = (
     "clarity", "actionability", "token_efficiency",
     "scope_discipline", "directive_precision", "novelty",
-]
-CRAFT_DIMS = [d for d in SKILL_DIMS if d != "novelty"]
-REF_DIMS = ["clarity", "instructional_value", "token_efficiency", "novelty", "skill_relevance"]
+)
+CRAFT_DIMS = tuple(d for d in SKILL_DIMS if d != "novelty")
+REF_DIMS = ("clarity", "instructional_value", "token_efficiency", "novelty", "skill_relevance")
+
+
+def _pearson_kernel(x, y):
+    """Pearson r of two equal-length float64 arrays; NaN on zero variance."""
+    dx = x - x.mean()
+    dy = y - y.mean()
+    sx = np.sqrt((dx * dx).sum())
+    sy = np.sqrt((dy * dy).sum())
+    if sx == 0.0 or sy == 0.0:
+        return np.nan
+    return (dx * dy).sum() / (sx * sy)
+
 
+if njit is not None:
+    # Compiled eagerly for the one signature we call it with; cache=True keeps
+    # the machine code in __pycache__ so later runs skip compilation.
+    _pearson_kernel = njit("float64(float64[:], float64[:])", cache=True)(_pearson_kernel)
 
-def pearson_r(x: list[float], y: list[float]) -> float:
+
+def pearson_r(x, y) -> float:
     """Pearson correlation coefficient. Returns NaN if n < 3."""
-    n = len(x)
-    if n < 3 or len(y) != n:
-        return float("nan")
-    mx, my = mean(x), mean(y)
-    cov = sum((xi - mx) * (yi - my) for xi, yi in zip(x, y))
-    sx = math.sqrt(sum((xi - mx) ** 2 for xi in x))
-    sy = math.sqrt(sum((yi - my) ** 2 for yi in y))
-    if sx == 0 or sy == 0:
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = x.size
+    if n < 3 or y.size != n:
         return float("nan")
-    return cov / (sx * sy)
+    return float(_pearson_kernel(x, y))
 
 
 def load_data():
-    """Load and join LLM scores with behavioral eval data."""
-    llm_data = json.loads(LLM_SCORES.read_text())
-    behav_data = json.loads(BEHAVIORAL.read_text())
-    combined_data = json.loads(COMBINED.read_text())
+    """Load and join LLM scores with behavioral eval data.
+
+    Returns (joined, unmatched, combined_data), where joined holds one
+    (name, llm_scores, behavioral, contamination_score) row per behavioral
+    eval skill that also has LLM scores, in behavioral eval order.
+    contamination_score is None when combined.json has no score for it.
+    """
+    llm_data = orjson.loads(LLM_SCORES.read_bytes())
+    behav_data = orjson.loads(BEHAVIORAL.read_bytes())
+    combined_data = orjson.loads(COMBINED.read_bytes())
 
     # LLM scores lookup by name
     llm_lookup: dict[str, dict] = {}
@@ -77,7 +104,17 @@ def load_data():
         if "contamination_score" in s:
             contam_lookup[s["name"]] = s["contamination_score"]
 
-    return llm_lookup, behav_lookup, contam_lookup, combined_data
+    # Join once on the behavioral eval skills
+    joined = []
+    unmatched = []
+    for name, behav in behav_lookup.items():
+        llm = llm_lookup.get(name)
+        if llm is None:
+            unmatched.append(name)
+        else:
+            joined.append((name, llm, behav, contam_lookup.get(name)))
+
+    return joined, unmatched, combined_data
 
 
 def print_section(title: str):
@@ -88,21 +125,29 @@ def print_section(title: str):
 
 
 def main():
-    llm_lookup, behav_lookup, contam_lookup, combined_data = load_data()
-
-    # Match skills present in both LLM scores and behavioral eval
-    matched = [name for name in behav_lookup if name in llm_lookup]
-    unmatched = [name for name in behav_lookup if name not in llm_lookup]
+    # Skills present in both LLM scores and behavioral eval
+    joined, unmatched, combined_data = load_data()
 
-    print(f"Matched skills: {len(matched)} / {len(behav_lookup)} behavioral eval skills")
+    print(f"Matched skills: {len(joined)} / {len(joined) + len(unmatched)} behavioral eval skills")
     if unmatched:
         print(f"  Unmatched: {', '.join(unmatched)}")
 
+    # Score and delta matrices over the joined rows; sections below slice columns
+    dim_col = {d: i for i, d in enumerate(SKILL_DIMS)}
+    get_scores = itemgetter(*SKILL_DIMS, "overall")
+    get_deltas = itemgetter("mean_delta_composite", "mean_delta_composite_realistic")
+    llm_mat = np.array(
+        [get_scores(llm) for _, llm, _, _ in joined], dtype=np.float64,
+    ).reshape(len(joined), len(SKILL_DIMS) + 1)
+    deltas = np.array(
+        [get_deltas(behav) for _, _, behav, _ in joined], dtype=np.float64,
+    ).reshape(len(joined), 2)
+
     # Extract delta vectors
-    ba_deltas = [behav_lookup[n]["mean_delta_composite"] for n in matched]
-    abs_ba = [abs(d) for d in ba_deltas]
-    da_deltas = [behav_lookup[n]["mean_delta_composite_realistic"] for n in matched]
-    abs_da = [abs(d) for d in da_deltas]
+    ba_deltas = deltas[:, 0]
+    abs_ba = np.abs(ba_deltas)
+    da_deltas = deltas[:, 1]
+    abs_da = np.abs(da_deltas)
 
     # ---- 1. Dimension correlations with behavioral deltas ----
     print_section("1. DIMENSION CORRELATIONS WITH BEHAVIORAL DELTAS")
@@ -110,7 +155,7 @@ def main():
     print("-" * 70)
 
     for dim in SKILL_DIMS:
-        vals = [llm_lookup[n][dim] for n in matched]
+        vals = llm_mat[:, dim_col[dim]]
         print(
             f"{dim:<25} "
             f"{pearson_r(vals, ba_deltas):>+10.3f} "
@@ -120,7 +165,7 @@ def main():
         )
 
     # Craft composite
-    craft = [mean([llm_lookup[n][d] for d in CRAFT_DIMS]) for n in matched]
+    craft = llm_mat[:, [dim_col[d] for d in CRAFT_DIMS]].mean(axis=1)
     print(
         f"{'craft_composite':<25} "
         f"{pearson_r(craft, ba_deltas):>+10.3f} "
@@ -130,7 +175,7 @@ def main():
     )
 
     # Overall composite
-    overall = [llm_lookup[n]["overall"] for n in matched]
+    overall = llm_mat[:, -1]
     print(
         f"{'overall_composite':<25} "
         f"{pearson_r(overall, ba_deltas):>+10.3f} "
@@ -140,7 +185,7 @@ def main():
     )
 
     # ---- 2. Headline: novelty vs |B-A| ----
-    novelty_vals = [llm_lookup[n]["novelty"] for n in matched]
+    novelty_vals = llm_mat[:, dim_col["novelty"]]
     r_headline = pearson_r(novelty_vals, abs_ba)
     print_section("2. HEADLINE: NOVELTY AMPLIFICATION")
     print(f"  novelty vs |B-A| = {r_headline:+.3f}")
@@ -150,15 +195,15 @@ def main():
     task_types = ["direct_target", "cross_language", "similar_syntax", "adjacent_domain", "grounded"]
     for tt in task_types:
         tt_d, tt_n = [], []
-        for n in matched:
-            dbt = behav_lookup[n].get("delta_by_task_type", {})
+        for (_, _, behav, _), nov in zip(joined, novelty_vals):
+            dbt = behav.get("delta_by_task_type", {})
             if tt in dbt:
                 tt_d.append(dbt[tt])
-                tt_n.append(llm_lookup[n]["novelty"])
+                tt_n.append(nov)
         if len(tt_n) >= 3:
             print(
                 f"  {tt:<20} r={pearson_r(tt_n, tt_d):+.3f}  "
-                f"r(abs)={pearson_r(tt_n, [abs(d) for d in tt_d]):+.3f}  "
+                f"r(abs)={pearson_r(tt_n, np.abs(tt_d)):+.3f}  "
                 f"n={len(tt_n)}"
             )
         else:
@@ -166,29 +211,58 @@ def main():
 
     # ---- 4. Structural contamination vs behavioral ----
     print_section("4. STRUCTURAL CONTAMINATION vs BEHAVIORAL DELTA")
-    contam_matched = [n for n in matched if n in contam_lookup]
-    if contam_matched:
-        c_vals = [contam_lookup[n] for n in contam_matched]
-        c_ba = [behav_lookup[n]["mean_delta_composite"] for n in contam_matched]
-        print(f"  contamination vs B-A: r = {pearson_r(c_vals, c_ba):+.3f}  n={len(contam_matched)}")
+    contam_rows = [i for i, row in enumerate(joined) if row[3] is not None]
+    if contam_rows:
+        c_vals = [joined[i][3] for i in contam_rows]
+        c_ba = ba_deltas[contam_rows]
+        print(f"  contamination vs B-A: r = {pearson_r(c_vals, c_ba):+.3f}  n={len(contam_rows)}")
     else:
         print("  No contamination scores available for matched skills")
 
-    # ---- 5. Novelty-contamination independence (full corpus) ----
-    # combined.json uses flat keys (llm_novelty, contamination_score)
-    print_section("5. NOVELTY-CONTAMINATION INDEPENDENCE (FULL CORPUS)")
+    # Gather every full-corpus series in a single pass over combined.json,
+    # which uses flat keys (llm_novelty, ref_llm_clarity, contamination_score, ...)
+    skill_keys = [(d, f"llm_{d}") for d in (*SKILL_DIMS, "overall")]
+    dim_keys = [f"llm_{d}" for d in SKILL_DIMS]
+    ref_keys = [(d, f"ref_llm_{d}") for d in (*REF_DIMS, "overall")]
     novelty_all, contam_all = [], []
     novelty_co, contam_co = [], []
+    score_rows = []
+    skill_vals: dict[str, list[float]] = defaultdict(list)
+    ref_vals: dict[str, list[float]] = defaultdict(list)
+    source_scores: dict[str, list[float]] = defaultdict(list)
+    source_novelty: dict[str, list[float]] = defaultdict(list)
     for s in combined_data["skills"]:
+        src = s["source"]
+        for d, key in skill_keys:
+            v = s.get(key)
+            if v is not None:
+                skill_vals[d].append(v)
+        for d, key in ref_keys:
+            v = s.get(key)
+            if v is not None:
+                ref_vals[d].append(v)
+
+        row = [s.get(key) for key in dim_keys]
+        if all(v is not None for v in row):
+            score_rows.append(row)
+
         nov = s.get("llm_novelty")
         contam = s.get("contamination_score")
-        if nov is not None and contam is not None:
-            novelty_all.append(nov)
-            contam_all.append(contam)
-            if s["source"] == "company":
-                novelty_co.append(nov)
-                contam_co.append(contam)
+        if nov is not None:
+            source_novelty[src].append(nov)
+            if contam is not None:
+                novelty_all.append(nov)
+                contam_all.append(contam)
+                if src == "company":
+                    novelty_co.append(nov)
+                    contam_co.append(contam)
+
+        overall_score = s.get("llm_overall")
+        if overall_score is not None:
+            source_scores[src].append(overall_score)
 
+    # ---- 5. Novelty-contamination independence (full corpus) ----
+    print_section("5. NOVELTY-CONTAMINATION INDEPENDENCE (FULL CORPUS)")
     if novelty_all:
         print(f"  All sources:  r = {pearson_r(novelty_all, contam_all):+.3f}  n={len(novelty_all)}")
     if novelty_co:
@@ -196,116 +270,85 @@ def main():
 
     # ---- 6. LLM dimension intercorrelations (full corpus) ----
     print_section("6. LLM DIMENSION INTERCORRELATIONS (FULL CORPUS)")
-    all_scores: dict[str, list[float]] = {d: [] for d in SKILL_DIMS}
-    for s in combined_data["skills"]:
-        llm_keys = {d: s.get(f"llm_{d}") for d in SKILL_DIMS}
-        if all(v is not None for v in llm_keys.values()):
-            for d in SKILL_DIMS:
-                all_scores[d].append(llm_keys[d])
-
-    n_scored = len(all_scores["clarity"]) if all_scores["clarity"] else 0
+    n_scored = len(score_rows)
     print(f"  n = {n_scored} skills with full LLM scores")
     print()
+
+    # One corrcoef call over the (skills x dims) matrix yields every pair at once
+    if n_scored >= 3:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            corr = np.corrcoef(np.array(score_rows, dtype=np.float64), rowvar=False)
+    else:
+        corr = np.full((len(SKILL_DIMS), len(SKILL_DIMS)), np.nan)
+    dim_idx = {d: i for i, d in enumerate(SKILL_DIMS)}
+
     # Craft-craft correlations
     print("  Craft cluster (non-novelty):")
     for i, d1 in enumerate(CRAFT_DIMS):
         for d2 in CRAFT_DIMS[i + 1:]:
-            r = pearson_r(all_scores[d1], all_scores[d2])
+            r = corr[dim_idx[d1], dim_idx[d2]]
             print(f"    {d1} vs {d2}: r = {r:+.3f}")
 
     print()
     print("  Novelty vs craft dimensions:")
     for d in CRAFT_DIMS:
-        r = pearson_r(all_scores["novelty"], all_scores[d])
+        r = corr[dim_idx["novelty"], dim_idx[d]]
         print(f"    novelty vs {d}: r = {r:+.3f}")
 
     # ---- 7. Reference vs SKILL.md quality gap ----
-    # combined.json uses flat keys: llm_clarity, ref_llm_clarity, etc.
     print_section("7. REFERENCE vs SKILL.md QUALITY GAP")
     shared_dims = ["clarity", "token_efficiency", "novelty"]
     for dim in shared_dims:
-        skill_vals = [
-            s[f"llm_{dim}"]
-            for s in combined_data["skills"]
-            if s.get(f"llm_{dim}") is not None
-        ]
-        ref_vals = [
-            s[f"ref_llm_{dim}"]
-            for s in combined_data["skills"]
-            if s.get(f"ref_llm_{dim}") is not None
-        ]
-        if skill_vals and ref_vals:
+        if skill_vals[dim] and ref_vals[dim]:
+            skill_mean = mean(skill_vals[dim])
+            ref_mean = mean(ref_vals[dim])
             print(
-                f"  {dim}: SKILL.md={mean(skill_vals):.2f}, "
-                f"Ref={mean(ref_vals):.2f}, "
-                f"gap={mean(ref_vals) - mean(skill_vals):+.2f}"
+                f"  {dim}: SKILL.md={skill_mean:.2f}, "
+                f"Ref={ref_mean:.2f}, "
+                f"gap={ref_mean - skill_mean:+.2f}"
             )
 
     # Overall gap
-    skill_ov = [
-        s["llm_overall"]
-        for s in combined_data["skills"]
-        if s.get("llm_overall") is not None
-    ]
-    ref_ov = [
-        s["ref_llm_overall"]
-        for s in combined_data["skills"]
-        if s.get("ref_llm_overall") is not None
-    ]
-    if skill_ov and ref_ov:
+    if skill_vals["overall"] and ref_vals["overall"]:
+        skill_mean = mean(skill_vals["overall"])
+        ref_mean = mean(ref_vals["overall"])
         print(
-            f"  overall: SKILL.md={mean(skill_ov):.2f}, "
-            f"Ref={mean(ref_ov):.2f}, "
-            f"gap={mean(ref_ov) - mean(skill_ov):+.2f}"
+            f"  overall: SKILL.md={skill_mean:.2f}, "
+            f"Ref={ref_mean:.2f}, "
+            f"gap={ref_mean - skill_mean:+.2f}"
         )
 
     # ---- 8. Global dimension means ----
     print_section("8. GLOBAL DIMENSION MEANS")
     print("  SKILL.md:")
     for d in SKILL_DIMS:
-        vals = [
-            s[f"llm_{d}"]
-            for s in combined_data["skills"]
-            if s.get(f"llm_{d}") is not None
-        ]
+        vals = skill_vals[d]
         if vals:
             print(f"    {d}: {mean(vals):.2f}  (n={len(vals)})")
 
     print("  References:")
-    ref_key_map = {
-        "clarity": "ref_llm_clarity",
-        "instructional_value": "ref_llm_instructional_value",
-        "token_efficiency": "ref_llm_token_efficiency",
-        "novelty": "ref_llm_novelty",
-        "skill_relevance": "ref_llm_skill_relevance",
-    }
     for d in REF_DIMS:
-        key = ref_key_map[d]
-        vals = [s[key] for s in combined_data["skills"] if s.get(key) is not None]
+        vals = ref_vals[d]
         if vals:
             print(f"    {d}: {mean(vals):.2f}  (n={len(vals)})")
 
     # ---- 9. Source rankings ----
     print_section("9. SOURCE RANKINGS BY OVERALL LLM SCORE")
-    from collections import defaultdict
-    source_scores: dict[str, list[float]] = defaultdict(list)
-    for s in combined_data["skills"]:
-        if s.get("llm_overall") is not None:
-            source_scores[s["source"]].append(s["llm_overall"])
-
-    for src, vals in sorted(source_scores.items(), key=lambda x: -mean(x[1])):
-        print(f"  {src}: {mean(vals):.2f}  (n={len(vals)})")
+    # Compute each source's mean once, then rank on it
+    score_ranking = [(src, mean(vals), len(vals)) for src, vals in source_scores.items()]
+    score_ranking.sort(key=itemgetter(1), reverse=True)
+    for src, avg, n in score_ranking:
+        print(f"  {src}: {avg:.2f}  (n={n})")
 
     # ---- 10. Novelty 4+ by source ----
     print_section("10. NOVELTY DISTRIBUTION: % SCORING 4+ BY SOURCE")
-    source_novelty: dict[str, list[float]] = defaultdict(list)
-    for s in combined_data["skills"]:
-        if s.get("llm_novelty") is not None:
-            source_novelty[s["source"]].append(s["llm_novelty"])
-
-    for src, vals in sorted(source_novelty.items(), key=lambda x: -sum(1 for v in x[1] if v >= 4) / len(x[1])):
-        pct = sum(1 for v in vals if v >= 4) / len(vals) * 100
-        print(f"  {src}: {pct:.1f}%  (n={len(vals)}, mean={mean(vals):.2f})")
+    novelty_ranking = [
+        (src, sum(1 for v in vals if v >= 4) / len(vals), len(vals), mean(vals))
+        for src, vals in source_novelty.items()
+    ]
+    novelty_ranking.sort(key=itemgetter(1), reverse=True)
+    for src, frac, n, avg in novelty_ranking:
+        print(f"  {src}: {frac * 100:.1f}%  (n={n}, mean={avg:.2f})")
 
 
 if __name__ == "__main__":
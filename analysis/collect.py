@@ -15,20 +15,43 @@ within the submodule.
 
 from __future__ import annotations
 
-import json
+import configparser
+import functools
+import hashlib
+import itertools
+import os
+import re
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any, Optional
+
+import msgspec
+import orjson
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 DATA_DIR = REPO_ROOT / "data"
 RAW_DIR = DATA_DIR / "raw"
 SKILLS_DIR = DATA_DIR / "skills"
 PROCESSED_DIR = DATA_DIR / "processed"
+# Validator results of earlier runs, keyed per source (see source_cache_dir)
+CACHE_DIR = DATA_DIR / ".cache" / "validator"
 
 VALIDATOR = Path("/Users/dachary/workspace/skill-validator/skill-validator")
 
+# Child processes are started with an absolute executable path, no cwd and
+# close_fds=False, which lets subprocess use posix_spawn instead of
+# fork+exec. Python opens fds non-inheritable, so nothing extra leaks into
+# the children.
+GIT = shutil.which("git") or "git"
+
+# Raw results are only read back by aggregate.py, so they are written compact;
+# set PRETTY=1 for indented files meant for reading
+RAW_JSON_OPTION = orjson.OPT_INDENT_2 if os.environ.get("PRETTY") else 0
+
 # Source configuration
 # Each entry describes one git submodule in data/skills/:
 #   submodule: directory name under data/skills/
@@ -305,6 +328,27 @@ SOURCES = [
 ]
 
 
+def _read_origin_url(submodule_path: Path) -> str | None:
+    """Read remote.origin.url from a checkout's git config without running git.
+
+    Submodule checkouts have a .git file pointing at their git directory
+    ("gitdir: ../../.git/modules/<name>"), which is followed first.
+    """
+    git_dir = submodule_path / ".git"
+    if git_dir.is_file():
+        pointer = git_dir.read_text().strip()
+        if not pointer.startswith("gitdir:"):
+            return None
+        git_dir = submodule_path / pointer[len("gitdir:"):].strip()
+    commondir = git_dir / "commondir"
+    if commondir.is_file():
+        git_dir = git_dir / commondir.read_text().strip()
+
+    config = configparser.ConfigParser(strict=False, interpolation=None)
+    config.read(git_dir / "config")
+    return config.get('remote "origin"', "url", fallback=None)
+
+
 def get_submodule_metadata(submodule_path: Path) -> dict:
     """Get git commit SHA, date, and remote URL for a submodule."""
     meta = {
@@ -316,8 +360,8 @@ def get_submodule_metadata(submodule_path: Path) -> dict:
 
     try:
         result = subprocess.run(
-            ["git", "log", "-1", "--format=%H%n%aI"],
-            capture_output=True, text=True, cwd=str(submodule_path),
+            [GIT, "-C", str(submodule_path), "log", "-1", "--format=%H%n%aI"],
+            capture_output=True, text=True, close_fds=False,
         )
         if result.returncode == 0:
             lines = result.stdout.strip().split("\n")
@@ -326,81 +370,94 @@ def get_submodule_metadata(submodule_path: Path) -> dict:
     except Exception:
         pass
 
+    # The remote URL comes straight from the git config, which saves a
+    # second git process per submodule
     try:
-        result = subprocess.run(
-            ["git", "remote", "get-url", "origin"],
-            capture_output=True, text=True, cwd=str(submodule_path),
-        )
-        if result.returncode == 0:
-            meta["remote_url"] = result.stdout.strip()
-    except Exception:
+        meta["remote_url"] = _read_origin_url(submodule_path)
+    except (OSError, configparser.Error):
         pass
 
     return meta
 
 
-def _run_validator(skill_dir: Path, extra_args: list[str] | None = None) -> dict | None:
-    """Run skill-validator with optional extra arguments and return JSON result."""
+class MetadataResult(msgspec.Struct):
+    """The parts of a pass 2 (--skip structure) result that _merge_passes keeps.
+
+    Undeclared keys are skipped by the decoder rather than materialized.
+    Analysis fields stay UNSET when the validator omits them. Batch output
+    nests one result per skill under "skills".
+    """
+    skill_dir: str = ""
+    results: list[dict] = []
+    content_analysis: Any = msgspec.UNSET
+    contamination_analysis: Any = msgspec.UNSET
+    references_content_analysis: Any = msgspec.UNSET
+    references_contamination_analysis: Any = msgspec.UNSET
+    reference_reports: Any = msgspec.UNSET
+    skills: Optional[list[MetadataResult]] = None
+
+
+METADATA_DECODER = msgspec.json.Decoder(MetadataResult)
+
+
+def _run_validator(
+    skill_dirs: list[Path],
+    extra_args: list[str] | None = None,
+    decoder: msgspec.json.Decoder | None = None,
+):
+    """Run skill-validator over one or more skill directories and return JSON result.
+
+    The output is decoded with decoder when one is given, otherwise into
+    plain dicts and lists.
+    """
     cmd = [str(VALIDATOR), "check", "-o", "json"]
     if extra_args:
         cmd.extend(extra_args)
-    cmd.append(str(skill_dir))
+    cmd.extend(str(d) for d in skill_dirs)
+    target = skill_dirs[0] if len(skill_dirs) == 1 else f"{len(skill_dirs)} skill directories"
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        # Allow each directory the same time budget as a single-skill run.
+        # stdout stays bytes and goes straight to the decoder, with no text decode.
+        result = subprocess.run(cmd, capture_output=True, timeout=60 * len(skill_dirs), close_fds=False)
         if result.stdout.strip():
-            return json.loads(result.stdout)
+            if decoder is not None:
+                return decoder.decode(result.stdout)
+            return orjson.loads(result.stdout)
         else:
-            print(f"  WARNING: No output from validator for {skill_dir} (args: {extra_args})", file=sys.stderr)
+            print(f"  WARNING: No output from validator for {target} (args: {extra_args})", file=sys.stderr)
             if result.stderr:
-                print(f"  stderr: {result.stderr.strip()}", file=sys.stderr)
+                print(f"  stderr: {result.stderr.decode(errors='replace').strip()}", file=sys.stderr)
             return None
-    except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError) as e:
-        print(f"  ERROR validating {skill_dir}: {e}", file=sys.stderr)
-        return None
-
-
-def validate_skill(skill_dir: Path) -> dict | None:
-    """Run skill-validator in two passes and merge results.
-
-    Pass 1 (--only structure): deterministic structural validation that drives
-    pass/fail, errors, warnings, token_counts, and results. Includes internal
-    link integrity checks (references to files within the skill directory).
-
-    Pass 2 (--skip structure): external link checks, content analysis, and
-    contamination detection. External link results are stored separately in
-    'link_results' since they are environment-dependent and non-reproducible.
-    """
-    # Pass 1: structural validation (deterministic, drives pass/fail)
-    structure = _run_validator(skill_dir, ["--only", "structure"])
-    if structure is None:
+    except (subprocess.TimeoutExpired, orjson.JSONDecodeError, msgspec.DecodeError, FileNotFoundError) as e:
+        print(f"  ERROR validating {target}: {e}", file=sys.stderr)
         return None
 
-    # Pass 2: links + content + contamination (metadata), with per-file reference reports
-    metadata = _run_validator(skill_dir, ["--skip", "structure", "--per-file"])
 
+def _merge_passes(structure: dict, metadata: MetadataResult | None) -> dict:
+    """Merge a skill's pass 2 (metadata) result into its pass 1 (structure) result."""
     # Start with the structure pass as the base — it drives pass/fail
     merged = dict(structure)
 
-    if metadata:
+    if metadata is not None:
         # Pull in content and contamination analysis from pass 2
-        if "content_analysis" in metadata:
-            merged["content_analysis"] = metadata["content_analysis"]
-        if "contamination_analysis" in metadata:
-            merged["contamination_analysis"] = metadata["contamination_analysis"]
+        if metadata.content_analysis is not msgspec.UNSET:
+            merged["content_analysis"] = metadata.content_analysis
+        if metadata.contamination_analysis is not msgspec.UNSET:
+            merged["contamination_analysis"] = metadata.contamination_analysis
 
         # Reference file analysis (aggregate and per-file)
-        if "references_content_analysis" in metadata:
-            merged["references_content_analysis"] = metadata["references_content_analysis"]
-        if "references_contamination_analysis" in metadata:
-            merged["references_contamination_analysis"] = metadata["references_contamination_analysis"]
-        if "reference_reports" in metadata:
-            merged["reference_reports"] = metadata["reference_reports"]
+        if metadata.references_content_analysis is not msgspec.UNSET:
+            merged["references_content_analysis"] = metadata.references_content_analysis
+        if metadata.references_contamination_analysis is not msgspec.UNSET:
+            merged["references_contamination_analysis"] = metadata.references_contamination_analysis
+        if metadata.reference_reports is not msgspec.UNSET:
+            merged["reference_reports"] = metadata.reference_reports
 
         # External link results (environment-dependent) — report separately
         # The CLI now handles internal links as part of --only structure,
         # so pass 2 only contains external URL checks.
-        link_results = [r for r in metadata.get("results", []) if r.get("category") == "Links"]
-        non_link_results = [r for r in metadata.get("results", []) if r.get("category") != "Links"]
+        link_results = [r for r in metadata.results if r.get("category") == "Links"]
+        non_link_results = [r for r in metadata.results if r.get("category") != "Links"]
 
         merged["link_results"] = link_results
         merged["link_errors"] = sum(1 for r in link_results if r.get("level") == "error")
@@ -412,69 +469,251 @@ def validate_skill(skill_dir: Path) -> dict | None:
     return merged
 
 
-# Tracks saved skills per category: {category: {skill_name: submodule}}
-# Used to detect and resolve name collisions across submodules.
-_saved_skills = {}
+def validate_skill(skill_dir: Path) -> tuple[dict | None, bool]:
+    """Run skill-validator in two passes and merge results.
 
+    Pass 1 (--only structure): deterministic structural validation that drives
+    pass/fail, errors, warnings, token_counts, and results. Includes internal
+    link integrity checks (references to files within the skill directory).
 
-def save_result(result: dict, category: str, skill_name: str, submodule: str):
-    """Save a single skill's validator result, resolving name collisions.
+    Pass 2 (--skip structure): external link checks, content analysis, and
+    contamination detection. External link results are stored separately in
+    'link_results' since they are environment-dependent and non-reproducible.
 
-    If another submodule already saved a skill with the same name in this
-    category, both are renamed to {submodule}--{skill_name} to avoid
-    silent data loss.
+    Returns the merged result (None if pass 1 failed) and whether pass 2
+    succeeded. A result without pass 2 is still saved, but never cached.
     """
-    out_dir = RAW_DIR / category
-    out_dir.mkdir(parents=True, exist_ok=True)
-
-    if category not in _saved_skills:
-        _saved_skills[category] = {}
-
-    if skill_name in _saved_skills[category]:
-        existing_submodule = _saved_skills[category][skill_name]
-        if existing_submodule is not None and existing_submodule != submodule:
-            # First collision: rename the previously saved bare file to prefixed
-            old_path = out_dir / f"{skill_name}.json"
-            renamed_path = out_dir / f"{existing_submodule}--{skill_name}.json"
-            if old_path.exists():
-                renamed_path.unlink(missing_ok=True)
-                old_path.rename(renamed_path)
+    # Pass 1: structural validation (deterministic, drives pass/fail)
+    structure = _run_validator([skill_dir], ["--only", "structure"])
+    if structure is None:
+        return None, False
+
+    # Pass 2: links + content + contamination (metadata), with per-file reference reports
+    metadata = _run_validator([skill_dir], ["--skip", "structure", "--per-file"], METADATA_DECODER)
+
+    return _merge_passes(structure, metadata), metadata is not None
+
+
+def validate_batch(skill_dirs: list[Path]) -> list[tuple[dict | None, bool]] | None:
+    """Validate several skill directories with one validator run per pass.
+
+    Returns one validate_skill-shaped (result, pass 2 succeeded) pair per
+    directory, in order. Returns None when either pass does not answer with
+    a {"skills": [...]} batch result; the caller then falls back to
+    validate_skill per directory, so a failed run costs at most one skill
+    its results rather than the source.
+    Directories missing from the batch output are validated on their own.
+    """
+    if len(skill_dirs) < 2:
+        return [validate_skill(d) for d in skill_dirs]
+
+    structure = _run_validator(skill_dirs, ["--only", "structure"])
+    if structure is None or "skills" not in structure:
+        return None
+    metadata = _run_validator(skill_dirs, ["--skip", "structure", "--per-file"], METADATA_DECODER)
+    if metadata is None or metadata.skills is None:
+        return None
+
+    metadata_by_dir = {os.path.normpath(m.skill_dir): m for m in metadata.skills}
+
+    # Batch entries are flat: a multi-skill directory contributes one entry
+    # per child skill, which is regrouped under that directory below
+    structure_by_dir = {}
+    children = {}
+    for entry in structure["skills"]:
+        entry_dir = os.path.normpath(entry["skill_dir"])
+        structure_by_dir[entry_dir] = entry
+        children.setdefault(os.path.dirname(entry_dir), []).append(entry)
+
+    results = []
+    for skill_dir in skill_dirs:
+        key = os.path.normpath(skill_dir)
+        if key in structure_by_dir and key in metadata_by_dir:
+            results.append((_merge_passes(structure_by_dir[key], metadata_by_dir[key]), True))
+        elif key in children:
+            # Same shape as validate_skill on a multi-skill directory
+            results.append(({"skills": children[key]}, True))
+        else:
+            results.append(validate_skill(skill_dir))
+    return results
+
+
+def find_collisions(saves: list[tuple]) -> set[tuple[str, str]]:
+    """Find (category, skill_name) pairs that more than one submodule saves.
+
+    saves holds (category, skill_name, submodule, result, cached_path)
+    tuples in collection order.
+    """
+    first_submodule = {}
+    collisions = set()
+    for category, skill_name, submodule, *_ in saves:
+        key = (category, skill_name)
+        existing_submodule = first_submodule.setdefault(key, submodule)
+        if existing_submodule != submodule and key not in collisions:
             print(f"  COLLISION: '{skill_name}' in {category}/ — "
                   f"renamed {existing_submodule} copy, prefixing both",
                   file=sys.stderr)
-            _saved_skills[category][skill_name] = None  # Mark as multi-source
+            collisions.add(key)
+    return collisions
+
+
+@functools.lru_cache(maxsize=None)
+def _category_dir(category: str) -> str:
+    """Return data/raw/{category} as a string, creating it on first use.
+
+    Plain strings on the per-skill path; the category set is small and fixed.
+    """
+    out_dir = os.path.join(RAW_DIR, category)
+    os.makedirs(out_dir, exist_ok=True)
+    return out_dir
 
-        # Save with prefix (whether first or subsequent collision)
-        if existing_submodule != submodule:
-            out_path = out_dir / f"{submodule}--{skill_name}.json"
-            with open(out_path, "w") as f:
-                json.dump(result, f, indent=2)
-            return
 
-    # First time seeing this name in this category
-    out_path = out_dir / f"{skill_name}.json"
-    _saved_skills[category][skill_name] = submodule
+def result_path(category: str, skill_name: str, submodule: str, collides: bool) -> str:
+    """Return the raw output path for a skill, creating its category dir.
 
-    with open(out_path, "w") as f:
-        json.dump(result, f, indent=2)
+    If the skill's name collides with one from another submodule in this
+    category (see find_collisions), every copy is saved as
+    {submodule}--{skill_name} to avoid silent data loss.
+    """
+    out_name = f"{submodule}--{skill_name}" if collides else skill_name
+    return os.path.join(_category_dir(category), out_name + ".json")
+
+
+def save_result(out_path: str, result: dict | None, cached_path: str | None = None):
+    """Save a single skill's validator result to out_path.
+
+    A result already serialized into the validator cache is hard-linked
+    from cached_path rather than serialized again.
+    """
+    # Replace rather than overwrite in place: out_path may be a hard link
+    # into the cache from an earlier run, and truncating it would alter the
+    # cached copy too
+    try:
+        os.unlink(out_path)
+    except FileNotFoundError:
+        pass
 
+    if cached_path is not None:
+        try:
+            os.link(cached_path, out_path)
+        except OSError:
+            # No hard links on this filesystem, or cache and output on different devices
+            shutil.copyfile(cached_path, out_path)
+        return
 
-def validate_and_save(skill_dir: Path, category: str, skill_name: str, submodule: str) -> int:
-    """Validate a single skill directory, handle multi-skill results, save."""
-    result = validate_skill(skill_dir)
+    # Serialize first, then write the whole blob; a buffered file's write
+    # keeps going until every byte is out, unlike a bare os.write
+    data = orjson.dumps(result, option=RAW_JSON_OPTION)
+    with open(out_path, "wb") as f:
+        f.write(data)
+
+
+def source_cache_dir(source: dict, root: Path, commit: str | None) -> Path | None:
+    """Return the cache directory for a source's validator results.
+
+    The key covers everything that changes the results: the submodule
+    commit, the validator binary, where and how skills are found, and the
+    raw output format. Returns None when the commit is unknown.
+    """
+    if not commit:
+        return None
+    key_parts = [
+        commit,
+        str(VALIDATOR.stat().st_mtime_ns),
+        str(root),
+        source["type"],
+        *source.get("exclude", []),
+        str(RAW_JSON_OPTION),
+    ]
+    key = hashlib.blake2b("\0".join(key_parts).encode(), digest_size=8).hexdigest()
+    return CACHE_DIR / source["submodule"] / key
+
+
+def load_cached_results(cache_dir: Path) -> tuple[str, list[tuple[str, str]]] | None:
+    """Return when a cache entry was validated and its (skill_name, cached_file) pairs.
+
+    Returns None if the entry is absent, was written in an older format, or
+    is missing any of its result files.
+    """
+    try:
+        manifest = orjson.loads((cache_dir / "manifest.json").read_bytes())
+        present = set(os.listdir(cache_dir))
+    except FileNotFoundError:
+        return None
+    if not isinstance(manifest, dict):
+        return None
+    files = [f"{i}.json" for i in range(len(manifest["skills"]))]
+    if not present.issuperset(files):
+        return None
+    return manifest["validated_at"], [
+        (name, os.path.join(cache_dir, file)) for name, file in zip(manifest["skills"], files)
+    ]
+
+
+def store_cached_results(
+    cache_dir: Path, entries: list[tuple[str, dict]], validated_at: str
+) -> list[str]:
+    """Serialize a source's results into its cache entry and return the file paths.
+
+    validated_at records when the results were produced: external link
+    checks in them reflect that date, not the date of a later cached run.
+    The manifest is written last, so an interrupted run leaves no entry that
+    load_cached_results would accept.
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i, (_, result) in enumerate(entries):
+        path = os.path.join(cache_dir, f"{i}.json")
+        save_result(path, result)
+        paths.append(path)
+    manifest = {"validated_at": validated_at, "skills": [name for name, _ in entries]}
+    (cache_dir / "manifest.json").write_bytes(orjson.dumps(manifest))
+    return paths
+
+
+def prune_cache(submodule_cache_dir: Path, keep: set[Path]):
+    """Remove a submodule's cache entries other than those in keep.
+
+    Every new commit or validator build gives a source a new entry; only
+    the entries this run uses can be hit again.
+    """
+    try:
+        with os.scandir(submodule_cache_dir) as it:
+            stale = [e.path for e in it if e.is_dir() and Path(e.path) not in keep]
+    except FileNotFoundError:
+        return
+    for path in stale:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def split_validation(result: dict | None, skill_name: str) -> list[tuple[str, dict]]:
+    """Split a skill's validator result into (skill_name, result) pairs.
+
+    Multi-skill results yield one pair per contained skill.
+    """
     if result is None:
-        return 0
+        return []
 
     if "skills" in result:
-        count = 0
-        for skill_result in result["skills"]:
-            sub_name = Path(skill_result["skill_dir"]).name
-            save_result(skill_result, category, sub_name, submodule)
-            count += 1
-        return count
+        return [(r["skill_dir"].rstrip("/").rsplit("/", 1)[-1], r) for r in result["skills"]]
     else:
-        save_result(result, category, skill_name, submodule)
-        return 1
+        return [(skill_name, result)]
+
+
+# Every spelling of SKILL.md that a case-insensitive match accepts, so a
+# directory listing can be checked with one set intersection
+SKILL_MD_NAMES = frozenset(
+    "".join(chars) for chars in itertools.product(*({c, c.lower()} for c in "SKILL.MD"))
+)
+
+# Memoized has_skill_md results: {skill_dir: bool}
+_has_skill_md_cache = {}
+
+
+def _has_skill_md_file(directory: str) -> bool:
+    """Check if a directory holds a SKILL.md file (any case)."""
+    names = SKILL_MD_NAMES.intersection(os.listdir(directory))
+    return any(os.path.isfile(os.path.join(directory, name)) for name in names)
 
 
 def has_skill_md(skill_dir: Path) -> bool:
@@ -488,47 +727,50 @@ def has_skill_md(skill_dir: Path) -> bool:
     which contains xlsx/, pdf/, etc. each with their own SKILL.md) while still
     filtering out support directories (like scripts/, _shared/).
     """
-    for child in skill_dir.iterdir():
-        if child.is_file() and child.name.upper() == "SKILL.MD":
-            return True
-        if child.is_dir():
-            for grandchild in child.iterdir():
-                if grandchild.is_file() and grandchild.name.upper() == "SKILL.MD":
-                    return True
-    return False
-
-
-def process_single_skill(skill_dir: Path, category: str, skill_name: str, submodule: str) -> int:
-    """Validate a single skill and save results."""
+    if skill_dir in _has_skill_md_cache:
+        return _has_skill_md_cache[skill_dir]
+
+    # Most candidates are skills themselves, so the subdirectory scan only
+    # runs when the directory has no SKILL.md of its own
+    found = _has_skill_md_file(skill_dir)
+    if not found:
+        with os.scandir(skill_dir) as it:
+            found = any(child.is_dir() and _has_skill_md_file(child.path) for child in it)
+    _has_skill_md_cache[skill_dir] = found
+    return found
+
+
+def process_single_skill(skill_dir: Path, category: str, skill_name: str, submodule: str) -> list[tuple]:
+    """Return the validation job for a single skill."""
     if not skill_dir.exists():
         print(f"  SKIP: {skill_dir} does not exist", file=sys.stderr)
-        return 0
-    return validate_and_save(skill_dir, category, skill_name, submodule)
+        return []
+    return [(skill_dir, category, skill_name, submodule)]
 
 
-def process_collection(base_dir: Path, category: str, submodule: str) -> int:
-    """Process a directory containing skill subdirectories."""
+def process_collection(base_dir: Path, category: str, submodule: str) -> list[tuple]:
+    """Return validation jobs for a directory containing skill subdirectories."""
     if not base_dir.exists():
         print(f"  SKIP: {base_dir} does not exist", file=sys.stderr)
-        return 0
+        return []
 
-    count = 0
+    jobs = []
     for entry in sorted(base_dir.iterdir()):
         if entry.is_dir() and not entry.name.startswith("."):
             if not has_skill_md(entry):
                 print(f"  SKIP: {entry.name}/ has no SKILL.md (not a skill)", file=sys.stderr)
                 continue
-            count += validate_and_save(entry, category, entry.name, submodule)
-    return count
+            jobs.append((entry, category, entry.name, submodule))
+    return jobs
 
 
-def process_nested_collection(base_dir: Path, category: str, submodule: str) -> int:
-    """Process a directory of category subdirs, each containing skill subdirs."""
+def process_nested_collection(base_dir: Path, category: str, submodule: str) -> list[tuple]:
+    """Return validation jobs for a directory of category subdirs, each containing skill subdirs."""
     if not base_dir.exists():
         print(f"  SKIP: {base_dir} does not exist", file=sys.stderr)
-        return 0
+        return []
 
-    count = 0
+    jobs = []
     for cat_dir in sorted(base_dir.iterdir()):
         if cat_dir.is_dir() and not cat_dir.name.startswith("."):
             for entry in sorted(cat_dir.iterdir()):
@@ -536,17 +778,17 @@ def process_nested_collection(base_dir: Path, category: str, submodule: str) ->
                     if not has_skill_md(entry):
                         print(f"  SKIP: {cat_dir.name}/{entry.name}/ has no SKILL.md (not a skill)", file=sys.stderr)
                         continue
-                    count += validate_and_save(entry, category, entry.name, submodule)
-    return count
+                    jobs.append((entry, category, entry.name, submodule))
+    return jobs
 
 
-def process_plugins(base_dir: Path, category: str, submodule: str) -> int:
-    """Process plugin directories: {base_dir}/{plugin}/skills/{skill}/SKILL.md"""
+def process_plugins(base_dir: Path, category: str, submodule: str) -> list[tuple]:
+    """Return validation jobs for plugin directories: {base_dir}/{plugin}/skills/{skill}/SKILL.md"""
     if not base_dir.exists():
         print(f"  SKIP: {base_dir} does not exist", file=sys.stderr)
-        return 0
+        return []
 
-    count = 0
+    jobs = []
     for plugin_dir in sorted(base_dir.iterdir()):
         if not plugin_dir.is_dir() or plugin_dir.name.startswith("."):
             continue
@@ -558,30 +800,53 @@ def process_plugins(base_dir: Path, category: str, submodule: str) -> int:
                 if not has_skill_md(skill_dir):
                     print(f"  SKIP: {plugin_dir.name}/skills/{skill_dir.name}/ has no SKILL.md (not a skill)", file=sys.stderr)
                     continue
-                count += validate_and_save(skill_dir, category, skill_dir.name, submodule)
-    return count
+                jobs.append((skill_dir, category, skill_dir.name, submodule))
+    return jobs
 
 
-def process_find(base_dir: Path, category: str, submodule: str, exclude: list[str] = None) -> int:
-    """Recursively find all SKILL.md files and validate their parent directories.
+def _iter_skill_md_dirs(base_dir: Path, exclude_re: re.Pattern | None):
+    """Yield each directory under base_dir that holds a SKILL.md file.
+
+    Matches the same names as rglob("SKILL.[mM][dD]") and, like rglob,
+    descends into hidden directories but not into symlinked ones. exclude_re
+    is searched in "/"-joined paths relative to base_dir; a directory whose
+    path (with trailing "/") already matches is not descended into, since
+    every path below it would be excluded too.
+    """
+    stack = [(str(base_dir), "")]
+    while stack:
+        path, rel = stack.pop()
+        try:
+            it = os.scandir(path)
+        except PermissionError:
+            continue
+        with it:
+            for entry in it:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    sub_rel = f"{rel}{name}/"
+                    if exclude_re is None or not exclude_re.search(sub_rel):
+                        stack.append((entry.path, sub_rel))
+                elif name[:6] == "SKILL." and name[6:].lower() == "md":
+                    if exclude_re is None or not exclude_re.search(rel + name):
+                        yield Path(path)
+
+
+def process_find(base_dir: Path, category: str, submodule: str, exclude: list[str] = None) -> list[tuple]:
+    """Recursively find all SKILL.md files and return jobs for their parent directories.
 
     This handles repos with non-standard layouts by finding every SKILL.md
     and treating its parent directory as a skill.
     """
     if not base_dir.exists():
         print(f"  SKIP: {base_dir} does not exist", file=sys.stderr)
-        return 0
+        return []
 
-    exclude = exclude or []
+    # Exclude fragments are plain substrings; one alternation checks them all
+    exclude_re = re.compile("|".join(map(re.escape, exclude))) if exclude else None
 
-    # Find all SKILL.md files (case-insensitive)
-    skill_dirs = set()
-    for skill_md in base_dir.rglob("SKILL.[mM][dD]"):
-        # Check exclusions
-        rel_path = str(skill_md.relative_to(base_dir))
-        if any(ex in rel_path for ex in exclude):
-            continue
-        skill_dirs.add(skill_md.parent)
+    # Find all SKILL.md files (case-insensitive extension)
+    skill_dirs = set(_iter_skill_md_dirs(base_dir, exclude_re))
 
     # Detect intra-submodule name collisions by checking for duplicate dir names
     sorted_dirs = sorted(skill_dirs)
@@ -589,7 +854,7 @@ def process_find(base_dir: Path, category: str, submodule: str, exclude: list[st
     for d in sorted_dirs:
         name_counts[d.name] = name_counts.get(d.name, 0) + 1
 
-    count = 0
+    jobs = []
     for skill_dir in sorted_dirs:
         if name_counts[skill_dir.name] > 1:
             # Use grandparent--name to disambiguate (e.g. "iac-terraform--skills")
@@ -599,8 +864,8 @@ def process_find(base_dir: Path, category: str, submodule: str, exclude: list[st
                   file=sys.stderr)
         else:
             skill_name = skill_dir.name
-        count += validate_and_save(skill_dir, category, skill_name, submodule)
-    return count
+        jobs.append((skill_dir, category, skill_name, submodule))
+    return jobs
 
 
 def main():
@@ -614,7 +879,9 @@ def main():
         "sources": {},
     }
 
-    total = 0
+    # Discover every source's skill directories first, so validation can fan
+    # out across all of them at once
+    source_jobs = []
     for source in SOURCES:
         submodule = source["submodule"]
         skill_root = source["skill_root"]
@@ -636,31 +903,110 @@ def main():
         # Resolve skill root
         root = submodule_path / skill_root if skill_root != "." else submodule_path
 
-        print(f"Processing {submodule} ({stype}) → {category}/")
+        # Reuse the last run's results while nothing that affects them has
+        # changed; REVALIDATE=1 forces a fresh run (e.g. to recheck links)
+        cache_dir = source_cache_dir(source, root, metadata["sources"][submodule]["commit"])
+        cached = None
+        if cache_dir is not None and not os.environ.get("REVALIDATE"):
+            cached = load_cached_results(cache_dir)
+        if cached is not None:
+            source_jobs.append((submodule, stype, category, [], cache_dir, cached))
+            continue
 
         if stype == "single":
-            count = process_single_skill(root, category, submodule, submodule)
+            jobs = process_single_skill(root, category, submodule, submodule)
         elif stype == "collection":
-            count = process_collection(root, category, submodule)
+            jobs = process_collection(root, category, submodule)
         elif stype == "nested-collection":
-            count = process_nested_collection(root, category, submodule)
+            jobs = process_nested_collection(root, category, submodule)
         elif stype == "plugins":
-            count = process_plugins(root, category, submodule)
+            jobs = process_plugins(root, category, submodule)
         elif stype == "find":
-            count = process_find(root, category, submodule, exclude)
+            jobs = process_find(root, category, submodule, exclude)
         else:
             print(f"  Unknown type: {stype}", file=sys.stderr)
-            count = 0
+            jobs = []
+
+        source_jobs.append((submodule, stype, category, jobs, cache_dir, None))
+
+    # This run's cache entries; other entries of the same sources are stale
+    cache_dirs = {source[4] for source in source_jobs if source[4] is not None}
+
+    # Each source's skills go to the validator as one batch, and sources are
+    # validated concurrently; threads are enough since the work happens in
+    # skill-validator child processes. Results are gathered in job order.
+    saves = []
+    total = 0
+    with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2) as executor:
+        batches = executor.map(
+            validate_batch, [[job[0] for job in source[3]] for source in source_jobs]
+        )
+        for (submodule, stype, category, jobs, cache_dir, cached), results in zip(source_jobs, batches):
+            print(f"Processing {submodule} ({stype}) → {category}/")
+
+            if cached is not None:
+                validated_at, cached_files = cached
+                for name, cached_path in cached_files:
+                    saves.append((category, name, submodule, None, cached_path))
+                metadata["sources"][submodule]["skill_count"] = len(cached_files)
+                metadata["sources"][submodule]["validated_at"] = validated_at
+                print(f"  → {len(cached_files)} skills collected (cached, validated {validated_at})")
+                total += len(cached_files)
+                continue
 
-        metadata["sources"][submodule]["skill_count"] = count
-        print(f"  → {count} skills collected")
-        total += count
+            if results is None:
+                # Validator did not return a batch result; validate one skill at a time
+                results = executor.map(validate_skill, [job[0] for job in jobs])
+
+            entries = []
+            complete = True
+            for (_, _, skill_name, _), (result, analyzed) in zip(jobs, results):
+                complete = complete and result is not None and analyzed
+                entries.extend(split_validation(result, skill_name))
+
+            # Only a source whose skills all passed both validator runs is
+            # cached, so a failed or partial run is retried next time
+            metadata["sources"][submodule]["validated_at"] = metadata["analysis_date"]
+            if cache_dir is not None and complete:
+                cached_paths = store_cached_results(cache_dir, entries, metadata["analysis_date"])
+                prune_cache(cache_dir.parent, cache_dirs)
+                for (name, _), cached_path in zip(entries, cached_paths):
+                    saves.append((category, name, submodule, None, cached_path))
+            else:
+                for name, skill_result in entries:
+                    saves.append((category, name, submodule, skill_result, None))
+
+            metadata["sources"][submodule]["skill_count"] = len(entries)
+            print(f"  → {len(entries)} skills collected")
+            total += len(entries)
+
+        # Every skill name is known now, so collisions are settled before any
+        # file is written rather than by renaming files already saved
+        collisions = find_collisions(saves)
+        for category, skill_name in collisions:
+            # Drop a bare copy left by an earlier run without the collision
+            try:
+                os.unlink(os.path.join(_category_dir(category), skill_name + ".json"))
+            except FileNotFoundError:
+                pass
+
+        # Later saves to the same path win, as they would written in order;
+        # the remaining writes are independent and go out on the pool
+        writes = {}
+        for category, skill_name, submodule, result, cached_path in saves:
+            out_path = result_path(category, skill_name, submodule, (category, skill_name) in collisions)
+            writes[out_path] = (result, cached_path)
+        list(executor.map(
+            save_result,
+            writes,
+            [result for result, _ in writes.values()],
+            [cached_path for _, cached_path in writes.values()],
+        ))
 
     # Save metadata
     PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
     metadata_path = PROCESSED_DIR / "snapshot-metadata.json"
-    with open(metadata_path, "w") as f:
-        json.dump(metadata, f, indent=2)
+    metadata_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
 
     print(f"\nTotal: {total} skills collected")
     print(f"Raw results: {RAW_DIR}")
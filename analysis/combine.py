@@ -12,168 +12,435 @@ One record per skill with all metrics.
 
 from __future__ import annotations
 
-import json
-import re
-import statistics
+import os
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from operator import attrgetter
 from pathlib import Path
+from typing import Iterable, Optional
+
+import msgspec
+import numpy as np
+import orjson
+
+try:
+    import ijson
+except ImportError:  # optional: only used to stream a large validation summary
+    ijson = None
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 PROCESSED = REPO_ROOT / "data" / "processed"
 SKILLS_DIR = REPO_ROOT / "data" / "skills"
+SKILLS_PREFIX = str(SKILLS_DIR) + "/"
 OUTPUT = PROCESSED / "combined.json"
+# Validation summaries at least this large are streamed skill by skill with
+# ijson (when installed) instead of being decoded in one shot
+STREAM_THRESHOLD = 1024 * 1024
+# Below this many skills, building records in worker processes costs more in
+# pickling than it saves
+PARALLEL_THRESHOLD = 4096
+# write_combined issues a few small writes per record; buffer them so they
+# reach the file in large chunks
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Record fields summed per source for the by_source breakdown
+SOURCE_SUM_KEYS = (
+    "total_tokens",
+    "skill_md_tokens",
+    "ref_tokens",
+    "asset_tokens",
+    "nonstandard_tokens",
+    "contamination_score",
+    "ref_contamination_score",
+    "link_errors",
+    "errors",
+    "warnings",
+    "information_density",
+    "instruction_specificity",
+)
+# LLM dimensions averaged per source (reported as avg_<key>)
+LLM_SOURCE_KEYS = (
+    "llm_clarity",
+    "llm_actionability",
+    "llm_token_efficiency",
+    "llm_scope_discipline",
+    "llm_directive_precision",
+    "llm_novelty",
+    "llm_overall",
+)
+# llm_index entry for skills without LLM scores
+NO_LLM_SCORES = ({}, {}, [])
+# token_budget_composition keys and the per-source token sums they are taken from
+TOKEN_BUDGET_KEYS = (
+    ("skill_md_pct", "skill_md_tokens"),
+    ("ref_pct", "ref_tokens"),
+    ("asset_pct", "asset_tokens"),
+    ("nonstandard_pct", "nonstandard_tokens"),
+)
+# Numeric record fields the summary stats and per-source breakdown reduce
+# over, one column each of a structured array. Missing LLM scores are NaN.
+STATS_DTYPE = np.dtype([
+    ("passed", np.bool_),
+    ("errors", np.int64),
+    ("warnings", np.int64),
+    ("link_errors", np.int64),
+    ("total_tokens", np.int64),
+    ("skill_md_tokens", np.int64),
+    ("ref_tokens", np.int64),
+    ("asset_tokens", np.int64),
+    ("nonstandard_tokens", np.int64),
+    ("information_density", np.float64),
+    ("instruction_specificity", np.float64),
+    ("contamination_score", np.float64),
+    ("ref_file_count", np.int64),
+    ("ref_total_tokens", np.int64),
+    ("ref_token_ratio", np.float64),
+    ("ref_max_file_tokens", np.int64),
+    ("ref_information_density", np.float64),
+    ("ref_contamination_score", np.float64),
+    ("refs_with_contamination", np.int64),
+    *((key, np.float64) for key in LLM_SOURCE_KEYS),
+    ("ref_llm_overall", np.float64),
+])
+
+
+class SkillRecord(msgspec.Struct, gc=False):
+    """One skill's row in combined.json.
+
+    Field order is the key order written to combined.json. Annotations are
+    evaluated by msgspec, so they use Optional rather than ``X | None`` to
+    stay importable on Python 3.9. Records only hold scalars and JSON
+    lists/dicts that never point back at a record, so they cannot form
+    reference cycles and are left untracked by the garbage collector.
+    """
+    # Validation data
+    name: str
+    source: str
+    github_url: str
+    passed: bool
+    errors: int
+    warnings: int
+    passes: int
+    total_tokens: int
+    skill_md_tokens: int
+    ref_tokens: int
+    asset_tokens: int
+    nonstandard_tokens: int
+
+    # Content analysis data
+    word_count: int
+    code_block_count: int
+    code_block_ratio: float
+    code_languages: list
+    sentence_count: int
+    imperative_ratio: float
+    information_density: float
+    instruction_specificity: float
+    section_count: int
+    list_item_count: int
+
+    # Contamination analysis data
+    multi_interface_tools: list
+    language_mismatch: bool
+    scope_breadth: int
+    contamination_score: float
+    contamination_level: str
+    mismatched_categories: list
+
+    # Link health (separate from structural pass/fail)
+    link_errors: int
+    broken_links: list
+
+    # Reference file metrics
+    ref_file_count: int
+    ref_total_tokens: int
+    ref_token_ratio: float
+    ref_max_file_tokens: int
+    ref_word_count: int
+    ref_code_block_count: int
+    ref_information_density: float
+    ref_contamination_score: float
+    ref_contamination_level: str
+    refs_with_contamination: int
+    ref_code_languages: list
+
+    # LLM judge scores (None when not scored)
+    llm_clarity: Optional[int]
+    llm_actionability: Optional[int]
+    llm_token_efficiency: Optional[int]
+    llm_scope_discipline: Optional[int]
+    llm_directive_precision: Optional[int]
+    llm_novelty: Optional[int]
+    llm_overall: Optional[float]
+    llm_assessment: Optional[str]
+
+    # Reference file LLM judge scores (None when not scored)
+    ref_llm_clarity: Optional[float]
+    ref_llm_instructional_value: Optional[float]
+    ref_llm_token_efficiency: Optional[float]
+    ref_llm_novelty: Optional[float]
+    ref_llm_skill_relevance: Optional[float]
+    ref_llm_overall: Optional[float]
+    ref_llm_files_scored: Optional[int]
+    ref_llm_per_file: list
 
 
 def load_json(path: Path) -> dict:
-    with open(path) as f:
-        return json.load(f)
+    return orjson.loads(path.read_bytes())
 
 
-def _compute_reference_stats(skills: list[dict]) -> dict:
-    """Compute aggregate reference file statistics."""
-    with_refs = [s for s in skills if s["ref_file_count"] > 0]
-    total_ref_files = sum(s["ref_file_count"] for s in skills)
+def load_validation(path: Path) -> tuple[Optional[dict], Iterable[dict]]:
+    """Return the snapshot metadata and skill records of a validation summary.
+
+    Files over STREAM_THRESHOLD are streamed with ijson when it is installed:
+    the snapshot is read by a short first pass that stops once it is parsed,
+    and skills are yielded one at a time, so each parsed skill dict can be
+    released once its record is built.
+    """
+    if ijson is None or path.stat().st_size < STREAM_THRESHOLD:
+        validation = load_json(path)
+        return validation.get("snapshot"), validation["skills"]
+    with open(path, "rb") as f:
+        snapshot = next(ijson.items(f, "snapshot", use_float=True), None)
+    return snapshot, _stream_skills(path)
+
+
+def _stream_skills(path: Path) -> Iterable[dict]:
+    with open(path, "rb") as f:
+        yield from ijson.items(f, "skills.item", use_float=True)
+
+
+def _stats_array(skills: list[SkillRecord]) -> np.ndarray:
+    """Pack the STATS_DTYPE fields of every skill into a structured array."""
+    get_fields = attrgetter(*STATS_DTYPE.names)
+    return np.fromiter((get_fields(s) for s in skills), dtype=STATS_DTYPE, count=len(skills))
+
 
-    if with_refs:
-        avg_ref_info_density = round(sum(s["ref_information_density"] for s in with_refs) / len(with_refs), 3)
-        avg_ref_contamination = round(sum(s["ref_contamination_score"] for s in with_refs) / len(with_refs), 3)
+def _compute_reference_stats(stats: np.ndarray) -> dict:
+    """Compute aggregate reference file statistics."""
+    with_refs = stats[stats["ref_file_count"] > 0]
+    n_refs = len(with_refs)
+    ref_total_tokens = with_refs["ref_total_tokens"]
+
+    if n_refs:
+        avg_ref_info_density = round(float(with_refs["ref_information_density"].sum()) / n_refs, 3)
+        avg_ref_contamination = round(float(with_refs["ref_contamination_score"].sum()) / n_refs, 3)
+        pct_refs_larger = round(
+            100 * int((ref_total_tokens > with_refs["skill_md_tokens"]).sum()) / n_refs, 1
+        )
+        # One partition places the median ranks and the p99 rank (the same
+        # rank as sorted(...)[int(n * 0.99)]) without a full sort
+        lo, hi, p99_rank = (n_refs - 1) // 2, n_refs // 2, int(n_refs * 0.99)
+        ranked = np.partition(ref_total_tokens, (lo, hi, p99_rank))
+        median_ref_tokens = int((int(ranked[lo]) + int(ranked[hi])) / 2)
+        p99_ref_tokens = int(ranked[p99_rank])
     else:
         avg_ref_info_density = 0
         avg_ref_contamination = 0
-
-    ref_total_tokens = [s["ref_total_tokens"] for s in with_refs] if with_refs else []
-
-    pct_refs_larger = round(
-        100 * sum(1 for s in with_refs if s["ref_total_tokens"] > s["skill_md_tokens"]) / len(with_refs), 1
-    ) if with_refs else 0
+        pct_refs_larger = 0
+        median_ref_tokens = 0
+        p99_ref_tokens = 0
 
     return {
-        "skills_with_refs": len(with_refs),
-        "total_ref_files": total_ref_files,
+        "skills_with_refs": n_refs,
+        "total_ref_files": int(stats["ref_file_count"].sum()),
         "avg_ref_info_density": avg_ref_info_density,
         "avg_ref_contamination_score": avg_ref_contamination,
-        "refs_with_contamination": sum(s["refs_with_contamination"] for s in skills),
-        "oversized_refs": sum(1 for s in skills if s["ref_max_file_tokens"] > 50000),
-        "refs_larger_than_skill": sum(1 for s in skills if s["ref_token_ratio"] > 1),
+        "refs_with_contamination": int(stats["refs_with_contamination"].sum()),
+        "oversized_refs": int((stats["ref_max_file_tokens"] > 50000).sum()),
+        "refs_larger_than_skill": int((stats["ref_token_ratio"] > 1).sum()),
         "pct_refs_larger_than_skill": pct_refs_larger,
-        "median_ref_tokens": int(statistics.median(ref_total_tokens)) if ref_total_tokens else 0,
-        "p99_ref_tokens": int(sorted(ref_total_tokens)[int(len(ref_total_tokens) * 0.99)]) if ref_total_tokens else 0,
-        "skills_with_refs_over_50k": sum(1 for s in with_refs if s["ref_total_tokens"] > 50000),
+        "median_ref_tokens": median_ref_tokens,
+        "p99_ref_tokens": p99_ref_tokens,
+        "skills_with_refs_over_50k": int((ref_total_tokens > 50000).sum()),
     }
 
 
-def _build_github_url_index(snapshot: dict) -> dict[str, tuple[str, str]]:
-    """Build a mapping from submodule directory name to (github_base_url, commit_sha)."""
+def _build_github_url_index(snapshot: dict) -> dict[str, str]:
+    """Build a mapping from submodule directory name to its GitHub tree URL.
+
+    The tree URL (base URL plus commit, or "main" when the commit is
+    unknown) is shared by every skill in the submodule, so it is formatted
+    once here rather than per skill.
+    """
     index = {}
     for submodule_name, info in snapshot.get("sources", {}).items():
-        remote = info.get("remote_url", "")
-        commit = info.get("commit", "")
+        remote = info.get("remote_url")
+        if not remote:
+            # collect.py records None when the origin could not be read;
+            # there is nothing to link to, so the skill gets no URL
+            continue
         # Convert git remote URL to GitHub browse URL
-        base = re.sub(r"\.git$", "", remote)
-        index[submodule_name] = (base, commit)
+        base = remote.removesuffix(".git")
+        index[submodule_name] = f"{base}/tree/{info.get('commit') or 'main'}"
     return index
 
 
-def _compute_github_url(skill_dir: str, url_index: dict[str, tuple[str, str]]) -> str:
+def _compute_github_url(skill_dir: str, url_index: dict[str, str]) -> str:
     """Compute a GitHub URL for a skill given its local skill_dir path."""
-    skills_dir_str = str(SKILLS_DIR)
-    if not skill_dir.startswith(skills_dir_str):
+    if not skill_dir.startswith(SKILLS_PREFIX):
         return ""
 
     # skill_dir looks like: .../data/skills/<submodule>/<path_within_repo>
-    rel = skill_dir[len(skills_dir_str):].lstrip("/")
-    parts = rel.split("/", 1)
-    submodule = parts[0]
-    path_in_repo = parts[1] if len(parts) > 1 else ""
+    submodule, _, path_in_repo = skill_dir[len(SKILLS_PREFIX):].partition("/")
 
-    if submodule not in url_index:
+    tree_url = url_index.get(submodule)
+    if tree_url is None:
         return ""
-
-    base_url, commit = url_index[submodule]
-    ref = commit if commit else "main"
     if path_in_repo:
-        return f"{base_url}/tree/{ref}/{path_in_repo}"
-    return f"{base_url}/tree/{ref}"
+        return f"{tree_url}/{path_in_repo}"
+    return tree_url
 
 
-def _compute_token_stats(skills: list[dict]) -> dict:
-    """Compute min/max/median/mean of total_tokens."""
-    tokens = [s["total_tokens"] for s in skills]
-    if not tokens:
-        return {"min": 0, "max": 0, "median": 0, "mean": 0}
-    return {
-        "min": min(tokens),
-        "max": max(tokens),
-        "median": int(statistics.median(tokens)),
-        "mean": round(sum(tokens) / len(tokens)),
-    }
-
+def _compute_token_stats(stats: np.ndarray) -> tuple[dict, dict]:
+    """Compute total_tokens stats and nonstandard token stats.
 
-def _compute_nonstandard_stats(skills: list[dict]) -> dict:
-    """Compute nonstandard token statistics."""
-    effective = [s["total_tokens"] - s["nonstandard_tokens"] for s in skills]
-    tokens = [s["total_tokens"] for s in skills]
+    Both summaries are built from the same total_tokens column, so its
+    median and mean are taken once and shared.
+    """
+    n = len(stats)
+    tokens = stats["total_tokens"]
+    effective = tokens - stats["nonstandard_tokens"]
 
-    mean_total = sum(tokens) / len(tokens) if tokens else 0
-    mean_effective = sum(effective) / len(effective) if effective else 0
-    median_total = statistics.median(tokens) if tokens else 0
-    median_effective = statistics.median(effective) if effective else 0
+    if not n:
+        token_stats = {"min": 0, "max": 0, "median": 0, "mean": 0}
+        mean_total = mean_effective = median_total = median_effective = 0
+    else:
+        # Integer sums stay exact; only the final division is floating point
+        mean_total = int(tokens.sum()) / n
+        median_total = float(np.median(tokens))
+        mean_effective = int(effective.sum()) / n
+        median_effective = float(np.median(effective))
+        token_stats = {
+            "min": int(tokens.min()),
+            "max": int(tokens.max()),
+            "median": int(median_total),
+            "mean": round(mean_total),
+        }
 
-    return {
-        "skills_with_nonstandard": sum(1 for s in skills if s["nonstandard_tokens"] > 0),
+    nonstandard_stats = {
+        "skills_with_nonstandard": int((stats["nonstandard_tokens"] > 0).sum()),
         "mean_effective_tokens": round(mean_effective),
         "median_effective_tokens": int(median_effective),
         "inflation_mean_pct": round((mean_total / mean_effective - 1) * 100, 1) if mean_effective else 0,
         "inflation_median_pct": round((median_total / median_effective - 1) * 100, 1) if median_effective else 0,
-        "skills_below_10pct_skill_md": sum(
-            1 for s in skills if s["skill_md_tokens"] < 0.1 * s["total_tokens"]
-        ),
+        "skills_below_10pct_skill_md": int((stats["skill_md_tokens"] < 0.1 * tokens).sum()),
     }
+    return token_stats, nonstandard_stats
+
+
+def _compute_source_breakdown(stats: np.ndarray, source_ids: np.ndarray, sources: list[str]) -> dict:
+    """Compute the by_source breakdown from the stats columns.
+
+    source_ids holds each skill's index into sources. Per-source sums are
+    weighted bincounts, which add each column in record order, in one pass
+    per column.
+    """
+    n_sources = len(sources)
+
+    def source_sums(column: np.ndarray) -> list:
+        return np.bincount(source_ids, weights=column, minlength=n_sources).tolist()
+
+    totals = np.bincount(source_ids, minlength=n_sources).tolist()
+    passed = source_sums(stats["passed"])
+    sums = {key: source_sums(stats[key]) for key in SOURCE_SUM_KEYS}
+    llm_sums = {}
+    llm_counts = {}
+    for key in LLM_SOURCE_KEYS:
+        scored = ~np.isnan(stats[key])
+        llm_sums[key] = source_sums(np.where(scored, stats[key], 0))
+        llm_counts[key] = source_sums(scored)
+
+    by_source = {}
+    for i, source in enumerate(sources):
+        n = totals[i]
+        n_passed = int(passed[i])
+        total_tokens_sum = sums["total_tokens"][i]
+
+        # Per-source LLM dimension means
+        llm_means = {}
+        for src_key in LLM_SOURCE_KEYS:
+            count = llm_counts[src_key][i]
+            llm_means[f"avg_{src_key}"] = round(llm_sums[src_key][i] / count, 3) if count else None
+
+        by_source[source] = {
+            "total": n,
+            "passed": n_passed,
+            "failed": n - n_passed,
+            "avg_tokens": round(total_tokens_sum / n),
+            "avg_contamination_score": round(sums["contamination_score"][i] / n, 3),
+            "avg_ref_contamination_score": round(sums["ref_contamination_score"][i] / n, 3),
+            "broken_link_count": int(sums["link_errors"][i]),
+            "total_errors": int(sums["errors"][i]),
+            "total_warnings": int(sums["warnings"][i]),
+            "avg_information_density": round(sums["information_density"][i] / n, 3),
+            "avg_instruction_specificity": round(sums["instruction_specificity"][i] / n, 3),
+            **llm_means,
+            "token_budget_composition": {
+                pct_key: round(100 * sums[token_key][i] / total_tokens_sum, 1) if total_tokens_sum else 0
+                for pct_key, token_key in TOKEN_BUDGET_KEYS
+            },
+        }
+    return by_source
 
 
-def _compute_net_negative_risk(skills: list[dict]) -> dict:
+def _compute_net_negative_risk(skills: list[SkillRecord]) -> dict:
     """Skills with low novelty AND medium/high contamination — potential net negatives.
 
     These skills add mixed-language interference risk without providing
     information the LLM doesn't already have. The theoretical net effect
     on agent performance is negative.
     """
-    scored = [s for s in skills if s.get("llm_novelty") is not None]
-    if not scored:
-        return {}
-
     # Strict threshold: novelty <= 2 and contamination >= 0.2
-    strict = [
-        s for s in scored
-        if s["llm_novelty"] <= 2 and s["contamination_score"] >= 0.2
-    ]
     # Broader threshold: novelty <= 3 and contamination >= 0.2
-    broad = [
-        s for s in scored
-        if s["llm_novelty"] <= 3 and s["contamination_score"] >= 0.2
-    ]
-
-    by_source_strict = Counter(s["source"] for s in strict)
-    by_source_broad = Counter(s["source"] for s in broad)
+    # Both, their per-source counts, the correlation inputs and the novelty
+    # of contaminated skills by source type are tallied in one pass over the
+    # skills that have a novelty score
+    novelty_vals = []
+    contam_vals = []
+    strict = []
+    broad_count = 0
+    scored_by_source = Counter()
+    by_source_strict = Counter()
+    by_source_broad = Counter()
+    company_contam_novelty = []
+    non_company_contam_novelty = []
+    for s in skills:
+        if s.llm_novelty is None:
+            continue
+        novelty_vals.append(s.llm_novelty)
+        contam_vals.append(s.contamination_score)
+        scored_by_source[s.source] += 1
+        if s.contamination_score < 0.2:
+            continue
+        if s.llm_novelty <= 2:
+            strict.append(s)
+            by_source_strict[s.source] += 1
+        if s.llm_novelty <= 3:
+            broad_count += 1
+            by_source_broad[s.source] += 1
+        if s.source == "company":
+            company_contam_novelty.append(s.llm_novelty)
+        else:
+            non_company_contam_novelty.append(s.llm_novelty)
+
+    n = len(novelty_vals)
+    if not n:
+        return {}
 
     # Per-source rates (strict only)
     source_rates = {}
-    for source in sorted(set(s["source"] for s in scored)):
-        source_scored = [s for s in scored if s["source"] == source]
-        source_strict = [s for s in strict if s["source"] == source]
-        source_broad = [s for s in broad if s["source"] == source]
+    for source in sorted(scored_by_source):
+        n_source = scored_by_source[source]
         source_rates[source] = {
-            "total": len(source_scored),
-            "strict_count": len(source_strict),
-            "strict_pct": round(100 * len(source_strict) / len(source_scored), 1),
-            "broad_count": len(source_broad),
-            "broad_pct": round(100 * len(source_broad) / len(source_scored), 1),
+            "total": n_source,
+            "strict_count": by_source_strict[source],
+            "strict_pct": round(100 * by_source_strict[source] / n_source, 1),
+            "broad_count": by_source_broad[source],
+            "broad_pct": round(100 * by_source_broad[source] / n_source, 1),
         }
 
     # Novelty-contamination correlation
-    novelty_vals = [s["llm_novelty"] for s in scored]
-    contam_vals = [s["contamination_score"] for s in scored]
-    n = len(scored)
     if n > 1:
         mean_n = sum(novelty_vals) / n
         mean_c = sum(contam_vals) / n
@@ -185,36 +452,33 @@ def _compute_net_negative_risk(skills: list[dict]) -> dict:
         corr_all = 0
 
     # Mean novelty among contaminated skills, by source type
-    contaminated = [s for s in scored if s["contamination_score"] >= 0.2]
-    company_contam = [s for s in contaminated if s["source"] == "company"]
-    non_company_contam = [s for s in contaminated if s["source"] != "company"]
     mean_novelty_company_contam = (
-        round(sum(s["llm_novelty"] for s in company_contam) / len(company_contam), 3)
-        if company_contam else None
+        round(sum(company_contam_novelty) / len(company_contam_novelty), 3)
+        if company_contam_novelty else None
     )
     mean_novelty_non_company_contam = (
-        round(sum(s["llm_novelty"] for s in non_company_contam) / len(non_company_contam), 3)
-        if non_company_contam else None
+        round(sum(non_company_contam_novelty) / len(non_company_contam_novelty), 3)
+        if non_company_contam_novelty else None
     )
 
     # Top offenders: strict net-negative skills sorted by contamination
-    top_offenders = sorted(strict, key=lambda s: -s["contamination_score"])[:15]
+    top_offenders = sorted(strict, key=lambda s: -s.contamination_score)[:15]
     offender_list = [
         {
-            "name": s["name"],
-            "source": s["source"],
-            "contamination_score": s["contamination_score"],
-            "llm_novelty": s["llm_novelty"],
-            "llm_overall": s["llm_overall"],
+            "name": s.name,
+            "source": s.source,
+            "contamination_score": s.contamination_score,
+            "llm_novelty": s.llm_novelty,
+            "llm_overall": s.llm_overall,
         }
         for s in top_offenders
     ]
 
     return {
         "strict_count": len(strict),
-        "strict_pct": round(100 * len(strict) / len(scored), 1),
-        "broad_count": len(broad),
-        "broad_pct": round(100 * len(broad) / len(scored), 1),
+        "strict_pct": round(100 * len(strict) / n, 1),
+        "broad_count": broad_count,
+        "broad_pct": round(100 * broad_count / n, 1),
         "by_source_strict": dict(by_source_strict),
         "by_source_broad": dict(by_source_broad),
         "source_rates": source_rates,
@@ -225,213 +489,263 @@ def _compute_net_negative_risk(skills: list[dict]) -> dict:
     }
 
 
-def _compute_hidden_contamination(skills: list[dict]) -> dict:
+def _compute_hidden_contamination(skills: list[SkillRecord]) -> dict:
     """Skills with low SKILL.md contamination but medium/high ref contamination."""
-    hidden = [
-        s for s in skills
-        if s.get("ref_file_count", 0) > 0
-        and s["contamination_level"] == "low"
-        and s["ref_contamination_level"] in ("medium", "high")
-    ]
-
-    by_source = Counter(s["source"] for s in hidden)
-    high_ref = sum(1 for s in hidden if s["ref_contamination_level"] == "high")
-    medium_ref = sum(1 for s in hidden if s["ref_contamination_level"] == "medium")
+    total = 0
+    ref_levels = Counter()
+    by_source = Counter()
+    for s in skills:
+        if (
+            s.ref_file_count > 0
+            and s.contamination_level == "low"
+            and s.ref_contamination_level in ("medium", "high")
+        ):
+            total += 1
+            ref_levels[s.ref_contamination_level] += 1
+            by_source[s.source] += 1
 
     return {
-        "total": len(hidden),
-        "high_ref": high_ref,
-        "medium_ref": medium_ref,
+        "total": total,
+        "high_ref": ref_levels["high"],
+        "medium_ref": ref_levels["medium"],
         "by_source": dict(by_source),
     }
 
 
-def main():
-    validation = load_json(PROCESSED / "validation-summary.json")
+def _build_record(
+    skill: dict,
+    url_index: dict[str, str],
+    llm_index: dict[tuple[str, str], tuple[dict, dict, list]],
+) -> SkillRecord:
+    """Build one skill's combined record from its validation summary entry.
 
-    # LLM scores are optional — the pipeline works without them
-    llm_scores_path = PROCESSED / "llm-scores.json"
-    llm_index = {}
-    ref_llm_index = {}
-    if llm_scores_path.exists():
-        llm_data = load_json(llm_scores_path)
-        for skill in llm_data.get("skills", []):
-            key = (skill["name"], skill["source"])
-            llm_index[key] = skill.get("llm_scores") or {}
-            if skill.get("ref_llm_aggregate"):
-                ref_llm_index[key] = {
-                    "aggregate": skill["ref_llm_aggregate"],
-                    "per_file": skill.get("ref_llm_scores", []),
-                }
-
-    # Build GitHub URL index from snapshot metadata
-    url_index = _build_github_url_index(validation.get("snapshot", {}))
-
-    # Build combined records
-    combined_skills = []
-    for skill in validation["skills"]:
-        key = (skill["name"], skill["source"])
-
-        # Content analysis from skill-validator check (embedded in validation-summary)
-        ca = skill.get("content_analysis", {})
-        # Contamination analysis from skill-validator check (embedded in validation-summary)
-        cr = skill.get("contamination_analysis", {})
-
-        record = {
-            # Validation data
-            "name": skill["name"],
-            "source": skill["source"],
-            "github_url": _compute_github_url(skill.get("skill_dir", ""), url_index),
-            "passed": skill["passed"],
-            "errors": skill["errors"],
-            "warnings": skill["warnings"],
-            "passes": skill["passes"],
-            "total_tokens": skill["total_tokens"],
-            "skill_md_tokens": skill["skill_md_tokens"],
-            "ref_tokens": skill.get("ref_tokens", 0),
-            "asset_tokens": skill.get("asset_tokens", 0),
-            "nonstandard_tokens": skill.get("nonstandard_tokens", 0),
-
-            # Content analysis data
-            "word_count": ca.get("word_count", 0),
-            "code_block_count": ca.get("code_block_count", 0),
-            "code_block_ratio": ca.get("code_block_ratio", 0),
-            "code_languages": ca.get("code_languages", []),
-            "sentence_count": ca.get("sentence_count", 0),
-            "imperative_ratio": ca.get("imperative_ratio", 0),
-            "information_density": ca.get("information_density", 0),
-            "instruction_specificity": ca.get("instruction_specificity", 0),
-            "section_count": ca.get("section_count", 0),
-            "list_item_count": ca.get("list_item_count", 0),
-
-            # Contamination analysis data
-            "multi_interface_tools": cr.get("multi_interface_tools", []),
-            "language_mismatch": cr.get("language_mismatch", False),
-            "scope_breadth": cr.get("scope_breadth", 0),
-            "contamination_score": cr.get("contamination_score", 0),
-            "contamination_level": cr.get("contamination_level", "low"),
-            "mismatched_categories": cr.get("mismatched_categories", []),
-
-            # Link health (separate from structural pass/fail)
-            "link_errors": skill.get("link_errors", 0),
-            "broken_links": skill.get("broken_links", []),
-
-            # Reference file metrics
-            "ref_file_count": skill.get("ref_file_count", 0),
-            "ref_total_tokens": skill.get("ref_total_tokens", 0),
-            "ref_token_ratio": skill.get("ref_token_ratio", 0),
-            "ref_max_file_tokens": skill.get("ref_max_file_tokens", 0),
-            "ref_word_count": skill.get("ref_word_count", 0),
-            "ref_code_block_count": skill.get("ref_code_block_count", 0),
-            "ref_information_density": skill.get("ref_information_density", 0),
-            "ref_contamination_score": skill.get("ref_contamination_score", 0),
-            "ref_contamination_level": skill.get("ref_contamination_level", "low"),
-            "refs_with_contamination": skill.get("refs_with_contamination", 0),
-            "ref_code_languages": skill.get("ref_code_languages", []),
-        }
+    Top-level keys are always written by aggregate.py and are indexed
+    directly; the analysis dicts come from the validator and may be missing
+    or partial, so they keep their defaults.
+    """
+    key = (skill["name"], skill["source"])
+
+    # Content analysis from skill-validator check (embedded in validation-summary)
+    ca = skill.get("content_analysis", {})
+    # Contamination analysis from skill-validator check (embedded in validation-summary)
+    cr = skill.get("contamination_analysis", {})
+    llm, ref_agg, ref_llm_per_file = llm_index.get(key, NO_LLM_SCORES)
+
+    return SkillRecord(
+        # Validation data
+        name=skill["name"],
+        source=skill["source"],
+        github_url=_compute_github_url(skill["skill_dir"], url_index),
+        passed=skill["passed"],
+        errors=skill["errors"],
+        warnings=skill["warnings"],
+        passes=skill["passes"],
+        total_tokens=skill["total_tokens"],
+        skill_md_tokens=skill["skill_md_tokens"],
+        ref_tokens=skill["ref_tokens"],
+        asset_tokens=skill["asset_tokens"],
+        nonstandard_tokens=skill["nonstandard_tokens"],
+
+        # Content analysis data
+        word_count=ca.get("word_count", 0),
+        code_block_count=ca.get("code_block_count", 0),
+        code_block_ratio=ca.get("code_block_ratio", 0),
+        code_languages=ca.get("code_languages", []),
+        sentence_count=ca.get("sentence_count", 0),
+        imperative_ratio=ca.get("imperative_ratio", 0),
+        information_density=ca.get("information_density", 0),
+        instruction_specificity=ca.get("instruction_specificity", 0),
+        section_count=ca.get("section_count", 0),
+        list_item_count=ca.get("list_item_count", 0),
+
+        # Contamination analysis data
+        multi_interface_tools=cr.get("multi_interface_tools", []),
+        language_mismatch=cr.get("language_mismatch", False),
+        scope_breadth=cr.get("scope_breadth", 0),
+        contamination_score=cr.get("contamination_score", 0),
+        contamination_level=cr.get("contamination_level", "low"),
+        mismatched_categories=cr.get("mismatched_categories", []),
+
+        # Link health (separate from structural pass/fail)
+        link_errors=skill["link_errors"],
+        broken_links=skill["broken_links"],
+
+        # Reference file metrics
+        ref_file_count=skill["ref_file_count"],
+        ref_total_tokens=skill["ref_total_tokens"],
+        ref_token_ratio=skill["ref_token_ratio"],
+        ref_max_file_tokens=skill["ref_max_file_tokens"],
+        ref_word_count=skill["ref_word_count"],
+        ref_code_block_count=skill["ref_code_block_count"],
+        ref_information_density=skill["ref_information_density"],
+        ref_contamination_score=skill["ref_contamination_score"],
+        ref_contamination_level=skill["ref_contamination_level"],
+        refs_with_contamination=skill["refs_with_contamination"],
+        ref_code_languages=skill["ref_code_languages"],
 
         # LLM judge scores (if available)
-        llm = llm_index.get(key, {})
-        record["llm_clarity"] = llm.get("clarity")
-        record["llm_actionability"] = llm.get("actionability")
-        record["llm_token_efficiency"] = llm.get("token_efficiency")
-        record["llm_scope_discipline"] = llm.get("scope_discipline")
-        record["llm_directive_precision"] = llm.get("directive_precision")
-        record["llm_novelty"] = llm.get("novelty")
-        record["llm_overall"] = llm.get("overall")
-        record["llm_assessment"] = llm.get("brief_assessment")
+        llm_clarity=llm.get("clarity"),
+        llm_actionability=llm.get("actionability"),
+        llm_token_efficiency=llm.get("token_efficiency"),
+        llm_scope_discipline=llm.get("scope_discipline"),
+        llm_directive_precision=llm.get("directive_precision"),
+        llm_novelty=llm.get("novelty"),
+        llm_overall=llm.get("overall"),
+        llm_assessment=llm.get("brief_assessment"),
 
         # Reference file LLM judge scores (if available)
-        ref_llm = ref_llm_index.get(key, {})
-        ref_agg = ref_llm.get("aggregate", {})
-        record["ref_llm_clarity"] = ref_agg.get("clarity")
-        record["ref_llm_instructional_value"] = ref_agg.get("instructional_value")
-        record["ref_llm_token_efficiency"] = ref_agg.get("token_efficiency")
-        record["ref_llm_novelty"] = ref_agg.get("novelty")
-        record["ref_llm_skill_relevance"] = ref_agg.get("skill_relevance")
-        record["ref_llm_overall"] = ref_agg.get("overall")
-        record["ref_llm_files_scored"] = ref_agg.get("files_scored")
-        record["ref_llm_per_file"] = ref_llm.get("per_file", [])
-
-        combined_skills.append(record)
+        ref_llm_clarity=ref_agg.get("clarity"),
+        ref_llm_instructional_value=ref_agg.get("instructional_value"),
+        ref_llm_token_efficiency=ref_agg.get("token_efficiency"),
+        ref_llm_novelty=ref_agg.get("novelty"),
+        ref_llm_skill_relevance=ref_agg.get("skill_relevance"),
+        ref_llm_overall=ref_agg.get("overall"),
+        ref_llm_files_scored=ref_agg.get("files_scored"),
+        ref_llm_per_file=ref_llm_per_file,
+    )
+
+
+# (url_index, llm_index) in record-building worker processes
+_worker_indexes = None
+
+
+def _init_record_worker(url_index: dict[str, str], llm_index: dict):
+    """Hand the lookup indexes to a worker once rather than with every task."""
+    global _worker_indexes
+    _worker_indexes = (url_index, llm_index)
+
+
+def _build_record_in_worker(skill: dict) -> SkillRecord:
+    return _build_record(skill, *_worker_indexes)
+
+
+def write_combined(path: Path, combined: dict, pretty: bool = False):
+    """Write combined.json, streaming the skills array one record at a time.
+
+    Everything but "skills" is small and serialized in one go; each record
+    is then serialized on its own (and, when pretty, re-indented to its
+    nesting depth), so the whole document is never held in memory as one
+    buffer. The bytes match orjson.dumps(combined), with OPT_INDENT_2 when
+    pretty.
+    """
+    skills = combined["skills"]
+    head = {k: v for k, v in combined.items() if k != "skills"}
+    with open(path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        if not pretty:
+            # Reopen the head object to append "skills" as its last key
+            f.write(orjson.dumps(head)[:-1])
+            f.write(b',"skills":[')
+            for i, record in enumerate(skills):
+                if i:
+                    f.write(b",")
+                f.write(orjson.dumps(msgspec.structs.asdict(record)))
+            f.write(b"]}")
+            return
+        f.write(orjson.dumps(head, option=orjson.OPT_INDENT_2)[:-2])
+        if not skills:
+            f.write(b',\n  "skills": []\n}')
+            return
+        f.write(b',\n  "skills": [')
+        sep = b"\n    "
+        for i, record in enumerate(skills):
+            # Records are converted to dicts only here; JSON strings never
+            # contain a raw newline, so re-indenting on b"\n" is safe
+            blob = orjson.dumps(msgspec.structs.asdict(record), option=orjson.OPT_INDENT_2)
+            f.write(sep if i == 0 else b"," + sep)
+            f.write(blob.replace(b"\n", sep))
+        f.write(b"\n  ]\n}")
+
 
+def main():
+    # LLM scores are optional — the pipeline works without them
+    llm_scores_path = PROCESSED / "llm-scores.json"
+
+    # The input files are independent, so parse the LLM scores in the
+    # background while the validation summary is opened
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        llm_future = executor.submit(load_json, llm_scores_path) if llm_scores_path.exists() else None
+        snapshot, validation_skills = load_validation(PROCESSED / "validation-summary.json")
+        llm_data = llm_future.result() if llm_future else None
+
+    llm_skills = llm_data.get("skills", []) if llm_data is not None else []
+    # SKILL.md scores, reference aggregate and per-file reference scores,
+    # so each skill needs a single lookup
+    llm_index = {}
+    for skill in llm_skills:
+        ref_agg = skill.get("ref_llm_aggregate")
+        llm_index[(skill["name"], skill["source"])] = (
+            skill.get("llm_scores") or {},
+            ref_agg or {},
+            skill.get("ref_llm_scores", []) if ref_agg else [],
+        )
+
+    # Build GitHub URL index from snapshot metadata
+    url_index = _build_github_url_index(snapshot or {})
+
+    # Build combined records. Records are independent, so large in-memory
+    # inputs are split across processes; streamed input stays serial so the
+    # parsed skills are never all held at once.
+    if isinstance(validation_skills, list) and len(validation_skills) >= PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor(
+            initializer=_init_record_worker, initargs=(url_index, llm_index)
+        ) as executor:
+            combined_skills = list(executor.map(
+                _build_record_in_worker, validation_skills, chunksize=256
+            ))
+    else:
+        combined_skills = [_build_record(skill, url_index, llm_index) for skill in validation_skills]
+
+    # Summary totals and the per-source breakdown are column reductions over
+    # the stats array; sources are numbered in sorted order
+    n_skills = len(combined_skills)
+    stats = _stats_array(combined_skills)
+    sources = sorted({s.source for s in combined_skills})
+    source_index = {source: i for i, source in enumerate(sources)}
+    source_ids = np.fromiter(
+        (source_index[s.source] for s in combined_skills), dtype=np.intp, count=n_skills
+    )
+    contamination_levels = Counter(s.contamination_level for s in combined_skills)
+    passed = int(stats["passed"].sum())
+    link_errors = stats["link_errors"]
+    token_stats, nonstandard_stats = _compute_token_stats(stats)
     combined = {
-        "total_skills": len(combined_skills),
-        "snapshot": validation.get("snapshot"),
+        "total_skills": n_skills,
+        "snapshot": snapshot,
         "summary": {
-            "passed": sum(1 for s in combined_skills if s["passed"]),
-            "failed": sum(1 for s in combined_skills if not s["passed"]),
-            "total_errors": sum(s["errors"] for s in combined_skills),
-            "total_warnings": sum(s["warnings"] for s in combined_skills),
-            "avg_tokens": round(sum(s["total_tokens"] for s in combined_skills) / len(combined_skills)) if combined_skills else 0,
-            "avg_information_density": round(sum(s["information_density"] for s in combined_skills) / len(combined_skills), 3) if combined_skills else 0,
-            "avg_instruction_specificity": round(sum(s["instruction_specificity"] for s in combined_skills) / len(combined_skills), 3) if combined_skills else 0,
+            "passed": passed,
+            "failed": n_skills - passed,
+            "total_errors": int(stats["errors"].sum()),
+            "total_warnings": int(stats["warnings"].sum()),
+            "avg_tokens": round(int(stats["total_tokens"].sum()) / n_skills) if n_skills else 0,
+            "avg_information_density": (
+                round(float(stats["information_density"].sum()) / n_skills, 3) if n_skills else 0
+            ),
+            "avg_instruction_specificity": (
+                round(float(stats["instruction_specificity"].sum()) / n_skills, 3) if n_skills else 0
+            ),
             "contamination_distribution": {
-                "high": sum(1 for s in combined_skills if s["contamination_level"] == "high"),
-                "medium": sum(1 for s in combined_skills if s["contamination_level"] == "medium"),
-                "low": sum(1 for s in combined_skills if s["contamination_level"] == "low"),
+                "high": contamination_levels["high"],
+                "medium": contamination_levels["medium"],
+                "low": contamination_levels["low"],
             },
-            "has_llm_scores": sum(1 for s in combined_skills if s["llm_overall"] is not None),
-            "has_ref_llm_scores": sum(1 for s in combined_skills if s["ref_llm_overall"] is not None),
+            "has_llm_scores": int((~np.isnan(stats["llm_overall"])).sum()),
+            "has_ref_llm_scores": int((~np.isnan(stats["ref_llm_overall"])).sum()),
             "link_health": {
-                "total_broken": sum(s["link_errors"] for s in combined_skills),
-                "skills_with_broken_links": sum(1 for s in combined_skills if s["link_errors"] > 0),
+                "total_broken": int(link_errors.sum()),
+                "skills_with_broken_links": int((link_errors > 0).sum()),
             },
-            "reference_stats": _compute_reference_stats(combined_skills),
-            "token_stats": _compute_token_stats(combined_skills),
-            "nonstandard_stats": _compute_nonstandard_stats(combined_skills),
+            "reference_stats": _compute_reference_stats(stats),
+            "token_stats": token_stats,
+            "nonstandard_stats": nonstandard_stats,
             "hidden_contamination": _compute_hidden_contamination(combined_skills),
             "net_negative_risk": _compute_net_negative_risk(combined_skills),
         },
-        "by_source": {},
+        "by_source": _compute_source_breakdown(stats, source_ids, sources),
         "skills": combined_skills,
     }
 
-    # Per-source breakdown
-    sources = sorted(set(s["source"] for s in combined_skills))
-    for source in sources:
-        source_skills = [s for s in combined_skills if s["source"] == source]
-        n = len(source_skills)
-        total_tokens_sum = sum(s["total_tokens"] for s in source_skills)
-
-        # Per-source LLM dimension means
-        llm_dim_keys = [
-            ("llm_clarity", "avg_llm_clarity"),
-            ("llm_actionability", "avg_llm_actionability"),
-            ("llm_token_efficiency", "avg_llm_token_efficiency"),
-            ("llm_scope_discipline", "avg_llm_scope_discipline"),
-            ("llm_directive_precision", "avg_llm_directive_precision"),
-            ("llm_novelty", "avg_llm_novelty"),
-            ("llm_overall", "avg_llm_overall"),
-        ]
-        llm_means = {}
-        for src_key, out_key in llm_dim_keys:
-            vals = [s[src_key] for s in source_skills if s.get(src_key) is not None]
-            llm_means[out_key] = round(sum(vals) / len(vals), 3) if vals else None
-
-        combined["by_source"][source] = {
-            "total": n,
-            "passed": sum(1 for s in source_skills if s["passed"]),
-            "failed": sum(1 for s in source_skills if not s["passed"]),
-            "avg_tokens": round(total_tokens_sum / n),
-            "avg_contamination_score": round(sum(s["contamination_score"] for s in source_skills) / n, 3),
-            "avg_ref_contamination_score": round(sum(s["ref_contamination_score"] for s in source_skills) / n, 3),
-            "broken_link_count": sum(s["link_errors"] for s in source_skills),
-            "total_errors": sum(s["errors"] for s in source_skills),
-            "total_warnings": sum(s["warnings"] for s in source_skills),
-            "avg_information_density": round(sum(s["information_density"] for s in source_skills) / n, 3),
-            "avg_instruction_specificity": round(sum(s["instruction_specificity"] for s in source_skills) / n, 3),
-            **llm_means,
-            "token_budget_composition": {
-                "skill_md_pct": round(100 * sum(s["skill_md_tokens"] for s in source_skills) / total_tokens_sum, 1) if total_tokens_sum else 0,
-                "ref_pct": round(100 * sum(s["ref_tokens"] for s in source_skills) / total_tokens_sum, 1) if total_tokens_sum else 0,
-                "asset_pct": round(100 * sum(s["asset_tokens"] for s in source_skills) / total_tokens_sum, 1) if total_tokens_sum else 0,
-                "nonstandard_pct": round(100 * sum(s["nonstandard_tokens"] for s in source_skills) / total_tokens_sum, 1) if total_tokens_sum else 0,
-            },
-        }
-
-    with open(OUTPUT, "w") as f:
-        json.dump(combined, f, indent=2)
+    # Compact by default; set PRETTY=1 for an indented file meant for reading
+    write_combined(OUTPUT, combined, pretty=bool(os.environ.get("PRETTY")))
 
     print(f"Combined {len(combined_skills)} skills → {OUTPUT}")
     print(f"  Passed: {combined['summary']['passed']}, Failed: {combined['summary']['failed']}")
@@ -22,19 +22,32 @@ Caches results in analysis/.llm_cache/ to avoid re-scoring on re-runs.
 from __future__ import annotations
 
 import hashlib
-import json
 import os
 import re
 import sys
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
+import orjson
+
 REPO_ROOT = Path(__file__).resolve().parent.parent
 SKILLS_DIR = REPO_ROOT / "data" / "skills"
 VALIDATION_SUMMARY = REPO_ROOT / "data" / "processed" / "validation-summary.json"
 OUTPUT = REPO_ROOT / "data" / "processed" / "llm-scores.json"
 CACHE_DIR = Path(__file__).resolve().parent / ".llm_cache"
 
+# Maximum number of judge requests in flight at once (JUDGE_CONCURRENCY=N to
+# change it). Scoring is network-bound, so skills and reference files are
+# scored on worker threads; this cap keeps bursts within API rate limits.
+JUDGE_CONCURRENCY = int(os.environ.get("JUDGE_CONCURRENCY", "8"))
+_request_slots = threading.BoundedSemaphore(JUDGE_CONCURRENCY)
+# Attempts the API client makes after a rate limit (429), overload (529),
+# server error or dropped connection before call_judge gives up on an item.
+# The client backs off exponentially with jitter and honors retry-after.
+JUDGE_MAX_RETRIES = int(os.environ.get("JUDGE_MAX_RETRIES", "6"))
+
 # ---------------------------------------------------------------------------
 # SKILL.md judge prompt
 # ---------------------------------------------------------------------------
@@ -161,6 +174,13 @@ Respond with ONLY a JSON object in this exact format:
 
 REF_DIMS = ["clarity", "instructional_value", "token_efficiency", "novelty", "skill_relevance"]
 
+# A flat JSON object embedded in a judge response that has text around it
+JSON_OBJECT_RE = re.compile(r"\{[^{}]+\}", re.DOTALL)
+# The YAML frontmatter block at the top of a SKILL.md
+FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---", re.DOTALL)
+# Top-level name/description lines within the frontmatter block
+FRONTMATTER_FIELD_RE = re.compile(r"^(name|description):(.*)$", re.MULTILINE)
+
 
 def get_cache_key(content: str, prefix: str = "") -> str:
     """Generate a cache key from content with an optional prefix."""
@@ -168,21 +188,57 @@ def get_cache_key(content: str, prefix: str = "") -> str:
     return hashlib.sha256(raw.encode()).hexdigest()[:16]
 
 
+# Keys of the results stored in CACHE_DIR, listed once by load_cache_index()
+# so that content with no cached result never touches the filesystem
+_cache_keys: set[str] | None = None
+
+
+def load_cache_index():
+    """Record which cache entries exist with a single directory listing."""
+    global _cache_keys
+    try:
+        with os.scandir(CACHE_DIR) as it:
+            _cache_keys = {e.name[:-len(".json")] for e in it if e.name.endswith(".json")}
+    except FileNotFoundError:
+        _cache_keys = set()
+
+
+# One lock per cache key. The corpus repeats content across sources, so
+# concurrent workers can meet the same key; the first scores it while the
+# rest wait and then read its result from the cache, as in a serial run.
+_key_locks: dict[str, threading.Lock] = {}
+_key_locks_guard = threading.Lock()
+
+
+def cache_key_lock(cache_key: str) -> threading.Lock:
+    """Return the lock to hold while looking up and scoring cache_key."""
+    with _key_locks_guard:
+        return _key_locks.setdefault(cache_key, threading.Lock())
+
+
 def get_cached_result(cache_key: str) -> dict | None:
-    """Check if a cached result exists."""
-    cache_file = CACHE_DIR / f"{cache_key}.json"
-    if cache_file.exists():
-        with open(cache_file) as f:
-            return json.load(f)
-    return None
+    """Check if a cached result exists. An unreadable entry counts as a miss."""
+    if _cache_keys is not None and cache_key not in _cache_keys:
+        return None
+    try:
+        return orjson.loads((CACHE_DIR / f"{cache_key}.json").read_bytes())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return None
 
 
 def save_cache(cache_key: str, result: dict):
-    """Save a result to cache."""
+    """Save a result to cache.
+
+    The entry is written to a temporary file and renamed into place, so a
+    reader never sees a partly written file.
+    """
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
     cache_file = CACHE_DIR / f"{cache_key}.json"
-    with open(cache_file, "w") as f:
-        json.dump(result, f, indent=2)
+    tmp_file = CACHE_DIR / f"{cache_key}.json.tmp"
+    tmp_file.write_bytes(orjson.dumps(result))
+    os.replace(tmp_file, cache_file)
+    if _cache_keys is not None:
+        _cache_keys.add(cache_key)
 
 
 def compute_overall(scores: dict, dims: list[str]) -> float | None:
@@ -194,22 +250,23 @@ def compute_overall(scores: dict, dims: list[str]) -> float | None:
 def call_judge(prompt: str, content: str, client, max_tokens: int = 500) -> dict | None:
     """Send a judge prompt + content to the API and parse the JSON response."""
     try:
-        response = client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=max_tokens,
-            messages=[
-                {
-                    "role": "user",
-                    "content": f"{prompt}\n\n---\n\nCONTENT TO EVALUATE:\n\n{content[:32000]}",
-                }
-            ],
-        )
+        with _request_slots:
+            response = client.messages.create(
+                model="claude-sonnet-4-5-20250929",
+                max_tokens=max_tokens,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": f"{prompt}\n\n---\n\nCONTENT TO EVALUATE:\n\n{content[:32000]}",
+                    }
+                ],
+            )
         text = response.content[0].text.strip()
         if text.startswith("{"):
-            return json.loads(text)
-        match = re.search(r"\{[^{}]+\}", text, re.DOTALL)
+            return orjson.loads(text)
+        match = JSON_OBJECT_RE.search(text)
         if match:
-            return json.loads(match.group())
+            return orjson.loads(match.group())
         print(f"  WARNING: Could not parse JSON from response: {text[:100]}", file=sys.stderr)
         return None
     except Exception as e:
@@ -263,60 +320,30 @@ def validate_and_retry(
 
 def extract_frontmatter(content: str) -> tuple[str, str]:
     """Extract name and description from SKILL.md YAML frontmatter."""
-    fm_match = re.match(r"^---\s*\n(.*?)\n---", content, re.DOTALL)
+    fm_match = FRONTMATTER_RE.match(content)
     if not fm_match:
         return "", ""
-    fm_text = fm_match.group(1)
-    name = ""
-    description = ""
-    for line in fm_text.split("\n"):
-        if line.startswith("name:"):
-            name = line.split(":", 1)[1].strip()
-        elif line.startswith("description:"):
-            description = line.split(":", 1)[1].strip()
-    return name, description
-
-
-def score_reference_files(skill_dir: Path, skill_content: str, client) -> list[dict]:
-    """Score all reference files for a skill. Returns list of per-file score dicts."""
-    refs_dir = skill_dir / "references"
-    if not refs_dir.is_dir():
-        return []
+    # One scan for both fields; a repeated key keeps its last value
+    fields = {key: value.strip() for key, value in FRONTMATTER_FIELD_RE.findall(fm_match.group(1))}
+    return fields.get("name", ""), fields.get("description", "")
 
-    ref_files = sorted(refs_dir.iterdir())
-    if not ref_files:
-        return []
 
-    skill_name, skill_description = extract_frontmatter(skill_content)
-    if not skill_name:
-        skill_name = skill_dir.name
-    if not skill_description:
-        skill_description = "(no description provided)"
-
-    prompt = REF_JUDGE_PROMPT.format(
-        skill_name=skill_name,
-        skill_description=skill_description,
-    )
-
-    results = []
-    for ref_path in ref_files:
-        if not ref_path.is_file() or ref_path.suffix.lower() != ".md":
-            continue
-
-        try:
-            ref_content = ref_path.read_text(encoding="utf-8", errors="replace")
-        except Exception:
-            continue
+def score_reference_file(ref_path: Path, prompt: str, skill_name: str, client) -> dict | None:
+    """Score one reference file. Returns None for files that are skipped."""
+    try:
+        ref_content = ref_path.read_text(encoding="utf-8", errors="replace")
+    except Exception:
+        return None
 
-        if not ref_content.strip():
-            continue
+    if not ref_content.strip():
+        return None
 
-        cache_key = get_cache_key(ref_content, prefix=f"ref:{skill_name}")
+    cache_key = get_cache_key(ref_content, prefix=f"ref:{skill_name}")
+    with cache_key_lock(cache_key):
         cached = get_cached_result(cache_key)
         if cached:
             cached["overall"] = compute_overall(cached, REF_DIMS)
-            results.append({"file": ref_path.name, "scores": cached, "cached": True})
-            continue
+            return {"file": ref_path.name, "scores": cached, "cached": True}
 
         print(f"    Scoring ref {ref_path.name}...")
         result = call_judge(prompt, ref_content, client)
@@ -325,13 +352,43 @@ def score_reference_files(skill_dir: Path, skill_content: str, client) -> list[d
             result.pop("overall", None)
             result["overall"] = compute_overall(result, REF_DIMS)
             save_cache(cache_key, result)
-            results.append({"file": ref_path.name, "scores": result, "cached": False})
-        else:
-            results.append({"file": ref_path.name, "scores": None, "cached": False})
+            return {"file": ref_path.name, "scores": result, "cached": False}
+        return {"file": ref_path.name, "scores": None, "cached": False}
 
-        time.sleep(0.5)
 
-    return results
+def score_reference_files(skill_dir: Path, skill_content: str, client, executor) -> list[dict]:
+    """Score all reference files for a skill. Returns list of per-file score dicts.
+
+    Files are scored concurrently on executor; results keep sorted file order.
+    """
+    # Only markdown files are scored. DirEntry.is_file() answers from the
+    # directory listing, so filtering costs no extra stat per entry.
+    try:
+        with os.scandir(skill_dir / "references") as it:
+            ref_files = sorted(
+                Path(e.path) for e in it
+                if os.path.splitext(e.name)[1].lower() == ".md" and e.is_file()
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    if not ref_files:
+        return []
+
+    skill_name, skill_description = extract_frontmatter(skill_content)
+    if not skill_name:
+        skill_name = skill_dir.name
+    if not skill_description:
+        skill_description = "(no description provided)"
+
+    prompt = REF_JUDGE_PROMPT.format(
+        skill_name=skill_name,
+        skill_description=skill_description,
+    )
+
+    results = executor.map(
+        score_reference_file, ref_files, repeat(prompt), repeat(skill_name), repeat(client)
+    )
+    return [r for r in results if r is not None]
 
 
 def aggregate_ref_scores(ref_results: list[dict]) -> dict | None:
@@ -352,6 +409,55 @@ def aggregate_ref_scores(ref_results: list[dict]) -> dict | None:
     return agg
 
 
+def judge_skill(skill: dict, client, ref_executor) -> tuple[str, dict | None, list[dict]]:
+    """Score one skill's SKILL.md (pass 1) and its reference files (pass 2).
+
+    Returns the SKILL.md outcome ("scored", "cached", "failed" or "skipped"),
+    the llm-scores entry (None when skipped) and the per-file reference results.
+    """
+    name = skill["name"]
+    source = skill["source"]
+
+    skill_dir = skill.get("skill_dir", "")
+    skill_dir_path = Path(skill_dir) if skill_dir else SKILLS_DIR / source / name
+    skill_md = skill_dir_path / "SKILL.md"
+    # Open directly rather than checking exists() first: one lookup per skill
+    try:
+        content = skill_md.read_text(encoding="utf-8", errors="replace")
+    except (FileNotFoundError, NotADirectoryError):
+        return "skipped", None, []
+
+    # --- Pass 1: Score SKILL.md ---
+    cache_key = get_cache_key(content)
+    with cache_key_lock(cache_key):
+        result = get_cached_result(cache_key)
+        if result:
+            # Recompute overall from dimension scores (cache may predate this logic)
+            result["overall"] = compute_overall(result, SKILL_DIMS)
+            outcome = "cached"
+        else:
+            print(f"  Scoring {source}/{name}...")
+            result = score_skill_md(content, client)
+            if result:
+                save_cache(cache_key, result)
+                outcome = "scored"
+            else:
+                outcome = "failed"
+
+    entry = {"name": name, "source": source, "llm_scores": result}
+
+    # --- Pass 2: Score reference files ---
+    ref_results = score_reference_files(skill_dir_path, content, client, ref_executor)
+    if ref_results:
+        entry["ref_llm_scores"] = [
+            {"file": r["file"], "scores": r["scores"]}
+            for r in ref_results
+        ]
+        entry["ref_llm_aggregate"] = aggregate_ref_scores(ref_results)
+
+    return outcome, entry, ref_results
+
+
 def main():
     # Check for API key
     api_key = os.environ.get("ANTHROPIC_API_KEY")
@@ -367,78 +473,49 @@ def main():
         print("ERROR: anthropic package not installed. Run: pip install anthropic", file=sys.stderr)
         sys.exit(1)
 
-    client = anthropic.Anthropic(api_key=api_key)
+    client = anthropic.Anthropic(api_key=api_key, max_retries=JUDGE_MAX_RETRIES)
+
+    load_cache_index()
 
     # Load validation summary for skill list
-    with open(VALIDATION_SUMMARY) as f:
-        summary = json.load(f)
+    summary = orjson.loads(VALIDATION_SUMMARY.read_bytes())
 
     scores = []
-    skill_scored = 0
-    skill_cached = 0
-    skill_failed = 0
-    skill_skipped = 0
+    skill_outcomes = {"scored": 0, "cached": 0, "failed": 0, "skipped": 0}
     ref_files_scored = 0
     ref_files_cached = 0
     ref_skills_scored = 0
 
-    for skill in summary["skills"]:
-        name = skill["name"]
-        source = skill["source"]
-
-        skill_dir = skill.get("skill_dir", "")
-        skill_dir_path = Path(skill_dir) if skill_dir else SKILLS_DIR / source / name
-        skill_md = skill_dir_path / "SKILL.md"
-        if not skill_md.exists():
-            skill_skipped += 1
-            continue
-
-        content = skill_md.read_text(encoding="utf-8", errors="replace")
-
-        # --- Pass 1: Score SKILL.md ---
-        cache_key = get_cache_key(content)
-        result = get_cached_result(cache_key)
-        if result:
-            # Recompute overall from dimension scores (cache may predate this logic)
-            result["overall"] = compute_overall(result, SKILL_DIMS)
-            skill_cached += 1
-        else:
-            print(f"  Scoring {source}/{name}...")
-            result = score_skill_md(content, client)
-            if result:
-                save_cache(cache_key, result)
-                skill_scored += 1
-            else:
-                skill_failed += 1
-
-        entry = {"name": name, "source": source, "llm_scores": result}
-
-        # --- Pass 2: Score reference files ---
-        ref_results = score_reference_files(skill_dir_path, content, client)
-        if ref_results:
-            ref_skills_scored += 1
-            for r in ref_results:
-                if r.get("cached"):
-                    ref_files_cached += 1
-                elif r.get("scores"):
-                    ref_files_scored += 1
-
-            entry["ref_llm_scores"] = [
-                {"file": r["file"], "scores": r["scores"]}
-                for r in ref_results
-            ]
-            entry["ref_llm_aggregate"] = aggregate_ref_scores(ref_results)
-
-        scores.append(entry)
+    # Skills are scored on one pool and their reference files on another, so
+    # a skill waiting on its references never holds up a reference worker.
+    # map() yields in input order, keeping llm-scores.json ordered as before.
+    with ThreadPoolExecutor(max_workers=JUDGE_CONCURRENCY) as ref_executor:
+        with ThreadPoolExecutor(max_workers=JUDGE_CONCURRENCY) as executor:
+            outcomes = executor.map(
+                judge_skill, summary["skills"], repeat(client), repeat(ref_executor)
+            )
+            for outcome, entry, ref_results in outcomes:
+                skill_outcomes[outcome] += 1
+                if entry is None:
+                    continue
+                if ref_results:
+                    ref_skills_scored += 1
+                    for r in ref_results:
+                        if r.get("cached"):
+                            ref_files_cached += 1
+                        elif r.get("scores"):
+                            ref_files_scored += 1
+                scores.append(entry)
 
     # Save LLM scores
     OUTPUT.parent.mkdir(parents=True, exist_ok=True)
-    with open(OUTPUT, "w") as f:
-        json.dump({"skills": scores}, f, indent=2)
+    # Compact by default; set PRETTY=1 for an indented file meant for reading
+    option = orjson.OPT_INDENT_2 if os.environ.get("PRETTY") else 0
+    OUTPUT.write_bytes(orjson.dumps({"skills": scores}, option=option))
 
     print(f"\nLLM Judge scoring complete → {OUTPUT}")
-    print(f"  SKILL.md — Scored: {skill_scored}, Cached: {skill_cached}, "
-          f"Failed: {skill_failed}, Skipped: {skill_skipped}")
+    print(f"  SKILL.md — Scored: {skill_outcomes['scored']}, Cached: {skill_outcomes['cached']}, "
+          f"Failed: {skill_outcomes['failed']}, Skipped: {skill_outcomes['skipped']}")
     print(f"  References — Skills with refs scored: {ref_skills_scored}, "
           f"Files scored: {ref_files_scored}, Files cached: {ref_files_cached}")
 
@@ -18,13 +18,17 @@ Produces figures in paper/figures/:
 
 from __future__ import annotations
 
-import json
+import contextlib
+import io
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import matplotlib
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import matplotlib.ticker as ticker
+import msgspec
+import orjson
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 COMBINED = REPO_ROOT / "data" / "processed" / "combined.json"
@@ -54,9 +58,28 @@ COLORS = {
 }
 
 
+class TokenFile(msgspec.Struct):
+    file: str
+    tokens: int = 0
+
+
+class TokenCounts(msgspec.Struct):
+    files: list[TokenFile] = []
+
+
+class OtherTokenCounts(msgspec.Struct):
+    """The only part of a raw validator result the nonstandard breakdown reads.
+
+    Every other key is skipped by the decoder rather than materialized.
+    """
+    other_token_counts: TokenCounts = msgspec.field(default_factory=TokenCounts)
+
+
+OTHER_TOKEN_COUNTS_DECODER = msgspec.json.Decoder(OtherTokenCounts)
+
+
 def load_data():
-    with open(COMBINED) as f:
-        return json.load(f)
+    return orjson.loads(COMBINED.read_bytes())
 
 
 def fig_pass_fail_by_source(data):
@@ -487,27 +510,28 @@ def fig_nonstandard_breakdown(data):
 
     category_tokens = Counter()
     for jf in sorted(glob.glob(str(REPO_ROOT / "data" / "raw" / "*" / "*.json"))):
-        with open(jf) as f:
-            raw = json.load(f)
-        for finfo in raw.get("other_token_counts", {}).get("files", []):
-            fname = finfo["file"]
-            tokens = finfo.get("tokens", 0)
+        with open(jf, "rb") as f:
+            raw = OTHER_TOKEN_COUNTS_DECODER.decode(f.read())
+        for finfo in raw.other_token_counts.files:
+            fname = finfo.file
+            tokens = finfo.tokens
             upper = fname.upper()
+            lower = fname.lower()
             if "LICENSE" in upper or "LICENCE" in upper:
                 category_tokens["LICENSE files"] += tokens
             elif ".xsd" in fname or "ooxml" in fname:
                 category_tokens["OOXML schemas (XSD)"] += tokens
-            elif "benchmark" in fname.lower() or "results" in fname.lower():
+            elif "benchmark" in lower or "results" in lower:
                 category_tokens["Benchmarks & results"] += tokens
             elif fname.endswith((".js.map", "package-lock.json", ".pptx")):
                 category_tokens["Build artifacts"] += tokens
             elif "README" in upper:
                 category_tokens["README files"] += tokens
-            elif fname.startswith("templates/") or "template" in fname.lower():
+            elif fname.startswith("templates/") or "template" in lower:
                 category_tokens["Templates"] += tokens
             elif fname.endswith((".yaml", ".yml")) and "agents/" in fname:
                 category_tokens["Agent configs (YAML)"] += tokens
-            elif "dashboard" in fname.lower() or "vscode-extension" in fname.lower():
+            elif "dashboard" in lower or "vscode-extension" in lower:
                 category_tokens["UI/extension code"] += tokens
             elif fname.endswith(".skill"):
                 category_tokens["Legacy .skill files"] += tokens
@@ -931,17 +955,23 @@ def print_craft_vs_content_stats(data):
 
     sources = sorted(by_source.keys())
 
+    # Sources ranked on each dimension (best first), and each source's rank
+    # per dimension, built once and shared by the sections below
+    ranked = {}
+    rank_of = {}
+    for key, _ in dims:
+        source_vals = [(src, by_source[src][key]) for src in sources
+                       if by_source[src].get(key) is not None]
+        source_vals.sort(key=lambda x: -x[1])
+        ranked[key] = source_vals
+        rank_of[key] = {src: rank for rank, (src, _) in enumerate(source_vals, 1)}
+
     print(f"\n=== Craft vs. Content: Per-Dimension Source Profiles ===")
 
     # Per-dimension rankings
     print(f"\nPer-dimension means and rankings:")
     for key, label in dims:
-        source_vals = []
-        for src in sources:
-            val = by_source[src].get(key)
-            if val is not None:
-                source_vals.append((src, val))
-        source_vals.sort(key=lambda x: -x[1])
+        source_vals = ranked[key]
         high = source_vals[0][1] if source_vals else 0
         low = source_vals[-1][1] if source_vals else 0
         spread = high - low
@@ -954,7 +984,7 @@ def print_craft_vs_content_stats(data):
     print(f"\nDimension spread summary (most → least discriminating):")
     spreads = []
     for key, label in dims:
-        vals = [by_source[s][key] for s in sources if by_source[s].get(key) is not None]
+        vals = [val for _, val in ranked[key]]
         if vals:
             spreads.append((label, max(vals) - min(vals)))
     spreads.sort(key=lambda x: -x[1])
@@ -964,16 +994,7 @@ def print_craft_vs_content_stats(data):
     # Per-source strength/weakness
     print(f"\nPer-source relative strength and weakness:")
     for src in sources:
-        rankings = []
-        for key, label in dims:
-            # Compute rank for this source on this dimension
-            vals = [(s, by_source[s].get(key, 0)) for s in sources
-                    if by_source[s].get(key) is not None]
-            vals.sort(key=lambda x: -x[1])
-            for rank, (s, _) in enumerate(vals, 1):
-                if s == src:
-                    rankings.append((label, rank))
-                    break
+        rankings = [(label, rank_of[key][src]) for key, label in dims if src in rank_of[key]]
         if rankings:
             best = min(rankings, key=lambda x: x[1])
             worst = max(rankings, key=lambda x: x[1])
@@ -1021,28 +1042,54 @@ def print_net_negative_stats(data):
                   f"{o['source']}/{o['name']}")
 
 
+FIGURES = (
+    fig_pass_fail_by_source,
+    fig_token_distribution,
+    fig_content_quality,
+    fig_contamination_distribution,
+    fig_contamination_by_source,
+    fig_metrics_correlation,
+    fig_ref_language_distribution,
+    fig_ref_token_ratio,
+    fig_token_budget_composition,
+    fig_hidden_contamination,
+    fig_nonstandard_breakdown,
+
+    fig_llm_scores_by_source,
+    fig_llm_novelty_distribution,
+    fig_llm_dimension_correlations,
+    fig_llm_vs_heuristic,
+    fig_llm_ref_vs_skill,
+)
+
+# combined.json contents in figure worker processes
+_worker_data = None
+
+
+def _init_figure_worker(data):
+    """Hand the dataset to a worker once rather than with every figure."""
+    global _worker_data
+    _worker_data = data
+
+
+def _render_figure(fig_fn) -> str:
+    """Render one figure in a worker and return what it printed."""
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        fig_fn(_worker_data)
+    return buf.getvalue()
+
+
 def main():
     FIGURES_DIR.mkdir(parents=True, exist_ok=True)
     data = load_data()
 
     print("Generating figures...")
-    fig_pass_fail_by_source(data)
-    fig_token_distribution(data)
-    fig_content_quality(data)
-    fig_contamination_distribution(data)
-    fig_contamination_by_source(data)
-    fig_metrics_correlation(data)
-    fig_ref_language_distribution(data)
-    fig_ref_token_ratio(data)
-    fig_token_budget_composition(data)
-    fig_hidden_contamination(data)
-    fig_nonstandard_breakdown(data)
-
-    fig_llm_scores_by_source(data)
-    fig_llm_novelty_distribution(data)
-    fig_llm_dimension_correlations(data)
-    fig_llm_vs_heuristic(data)
-    fig_llm_ref_vs_skill(data)
+    # Figures are independent, so they are rendered in parallel; each one's
+    # progress line is printed here, in figure order
+    with ProcessPoolExecutor(initializer=_init_figure_worker, initargs=(data,)) as executor:
+        for output in executor.map(_render_figure, FIGURES):
+            print(output, end="")
 
     print_summary_stats(data)
     print_llm_stats(data)